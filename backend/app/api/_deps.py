@@ -0,0 +1,29 @@
+"""Shared FastAPI dependencies for API routers."""
+
+from fastapi import HTTPException, Query
+
+BBox = tuple[float, float, float, float]
+
+
+async def parse_bbox(
+    min_lon: float | None = Query(None, ge=-180, le=180, description="Bounding box minimum longitude"),
+    min_lat: float | None = Query(None, ge=-90, le=90, description="Bounding box minimum latitude"),
+    max_lon: float | None = Query(None, ge=-180, le=180, description="Bounding box maximum longitude"),
+    max_lat: float | None = Query(None, ge=-90, le=90, description="Bounding box maximum latitude"),
+) -> BBox | None:
+    """Collapse the four optional bbox query params into a tuple.
+
+    Returns None unless all four are given. Boxes crossing the
+    antimeridian (min_lon > max_lon) are rejected rather than silently
+    producing an empty ST_MakeEnvelope.
+    """
+    if min_lon is None or min_lat is None or max_lon is None or max_lat is None:
+        return None
+    if min_lat > max_lat:
+        raise HTTPException(status_code=400, detail="min_lat must not exceed max_lat")
+    if min_lon > max_lon:
+        raise HTTPException(
+            status_code=400,
+            detail="Bounding boxes crossing the antimeridian are not supported; split into two requests",
+        )
+    return (min_lon, min_lat, max_lon, max_lat)
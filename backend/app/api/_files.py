@@ -0,0 +1,27 @@
+"""Helpers for endpoints that return files from local disk."""
+
+import asyncio
+import os
+
+
+def _stat_or_none(path: str) -> os.stat_result | None:
+    try:
+        return os.stat(path)
+    except FileNotFoundError:
+        return None
+
+
+def file_etag(stat: os.stat_result) -> str:
+    """Strong ETag from a file's mtime and size."""
+    return f'"{stat.st_mtime_ns:x}-{stat.st_size:x}"'
+
+
+async def file_stat(path: str | None) -> os.stat_result | None:
+    """Stat `path` off the event loop; None if it is unset or missing.
+
+    Pass the result to FileResponse(stat_result=...) so Starlette does not
+    stat the file a second time.
+    """
+    if not path:
+        return None
+    return await asyncio.to_thread(_stat_or_none, path)
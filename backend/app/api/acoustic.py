@@ -2,15 +2,19 @@
 
 POST /api/v1/acoustic/fetch              -- trigger NOAA PMEL data fetch
 GET  /api/v1/acoustic/events             -- list acoustic events
+POST /api/v1/acoustic/correlate/batch      -- correlate many events in one query
 POST /api/v1/acoustic/correlate/{event_id} -- correlate event to AIS vessel
 """
 
 import logging
 
-from fastapi import APIRouter, Query, HTTPException, BackgroundTasks
+from fastapi import APIRouter, Query, HTTPException, BackgroundTasks, Depends
+from pydantic import BaseModel, Field
 
+from app.api._deps import BBox, parse_bbox
 from app.services.acoustic_service import (
     fetch_acoustic_events,
+    correlate_acoustic_batch,
     correlate_acoustic_to_ais,
     get_acoustic_events,
 )
@@ -20,13 +24,14 @@ logger = logging.getLogger("poseidon.api.acoustic")
 router = APIRouter()
 
 
+class CorrelateBatchRequest(BaseModel):
+    event_ids: list[int] = Field(..., min_length=1, max_length=1000)
+
+
 @router.post("/fetch")
 async def acoustic_fetch(
     background_tasks: BackgroundTasks,
-    min_lon: float | None = Query(None),
-    min_lat: float | None = Query(None),
-    max_lon: float | None = Query(None),
-    max_lat: float | None = Query(None),
+    bbox: BBox | None = Depends(parse_bbox),
     days: int = Query(7, ge=1, le=30, description="Days of data to fetch"),
 ):
     """Trigger acoustic data fetch from NOAA PMEL.
@@ -34,9 +39,6 @@ async def acoustic_fetch(
     Runs in the background; returns immediately with status.
     Currently stubbed - will activate when PMEL data feed is available.
     """
-    bbox = None
-    if all(v is not None for v in [min_lon, min_lat, max_lon, max_lat]):
-        bbox = (min_lon, min_lat, max_lon, max_lat)
 
     async def _fetch():
         try:
@@ -51,17 +53,10 @@ async def acoustic_fetch(
 
 @router.get("/events")
 async def list_events(
-    min_lon: float | None = Query(None),
-    min_lat: float | None = Query(None),
-    max_lon: float | None = Query(None),
-    max_lat: float | None = Query(None),
+    bbox: BBox | None = Depends(parse_bbox),
     hours: int = Query(48, ge=1, le=720, description="Lookback window in hours"),
 ):
     """List acoustic events with optional bbox and time filters."""
-    bbox = None
-    if all(v is not None for v in [min_lon, min_lat, max_lon, max_lat]):
-        bbox = (min_lon, min_lat, max_lon, max_lat)
-
     try:
         events = await get_acoustic_events(bbox=bbox, hours=hours)
     except Exception as e:
@@ -71,6 +66,39 @@ async def list_events(
     return {"count": len(events), "events": events}
 
 
+@router.post("/correlate/batch")
+async def correlate_events_batch(
+    body: CorrelateBatchRequest,
+    time_window_hours: float = Query(
+        2.0, ge=0.5, le=24, description="Time search window in hours"
+    ),
+    radius_km: float = Query(
+        100.0, ge=10, le=500, description="Spatial search radius in km"
+    ),
+):
+    """Correlate a set of acoustic events with their nearest AIS vessels.
+
+    Same search as /correlate/{event_id}, run for every event in a
+    single query. Events without a match are listed in `unmatched`.
+    """
+    event_ids = list(dict.fromkeys(body.event_ids))
+    try:
+        matches = await correlate_acoustic_batch(
+            event_ids,
+            time_window_hours=time_window_hours,
+            radius_km=radius_km,
+        )
+    except Exception as e:
+        logger.error("Acoustic batch correlation failed for %d events: %s", len(event_ids), e)
+        raise HTTPException(status_code=500, detail=str(e))
+
+    return {
+        "count": len(matches),
+        "matches": list(matches.values()),
+        "unmatched": [eid for eid in event_ids if eid not in matches],
+    }
+
+
 @router.post("/correlate/{event_id}")
 async def correlate_event(
     event_id: int,
@@ -1,3 +1,5 @@
+from typing import Literal
+
 from fastapi import APIRouter, Query, HTTPException
 
 from app.services.vessel_service import get_dark_vessel_alerts
@@ -6,10 +8,12 @@ from app.services.correlation_service import find_spoof_dark_correlations, get_c
 
 router = APIRouter()
 
+AlertStatusFilter = Literal["active", "resolved"]
+
 
 @router.get("/dark-vessels")
 async def dark_vessel_alerts(
-    status: str = Query("active", regex="^(active|resolved)$"),
+    status: AlertStatusFilter = Query("active"),
 ):
     alerts = await get_dark_vessel_alerts(status)
     return {"count": len(alerts), "alerts": alerts}
@@ -17,7 +21,7 @@ async def dark_vessel_alerts(
 
 @router.get("/spoof-clusters")
 async def spoof_clusters(
-    status: str = Query("active", regex="^(active|resolved)$"),
+    status: AlertStatusFilter = Query("active"),
     limit: int = Query(50, ge=1, le=500),
 ):
     clusters = await get_spoof_clusters(status, limit)
@@ -1,5 +1,6 @@
+import numpy as np
 from fastapi import APIRouter, HTTPException, Query
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 from app.services.aoi_service import (
     create_aoi, list_aois, delete_aoi, get_aoi_events, get_vessels_in_aoi,
@@ -13,7 +14,7 @@ class AOICreate(BaseModel):
     description: str | None = None
     polygon: list[list[float]]  # [[lon, lat], ...]
     alert_vessel_types: list[str] | None = None
-    alert_min_risk_score: int = 0
+    alert_min_risk_score: int = Field(0, ge=0, le=100)
 
 
 @router.get("")
@@ -24,11 +25,21 @@ async def list_areas(active_only: bool = Query(True)):
 
 @router.post("")
 async def create_area(body: AOICreate):
-    if len(body.polygon) < 3:
+    try:
+        coords = np.asarray(body.polygon, dtype=np.float64)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Polygon vertices must be [lon, lat] pairs")
+    if coords.ndim != 2 or coords.shape[1] != 2:
+        raise HTTPException(status_code=400, detail="Polygon vertices must be [lon, lat] pairs")
+    if coords.shape[0] < 3:
         raise HTTPException(status_code=400, detail="Polygon must have at least 3 points")
+    lon, lat = coords[:, 0], coords[:, 1]
+    # NaN fails every comparison, so this also rejects non-finite values
+    if not ((lon >= -180) & (lon <= 180) & (lat >= -90) & (lat <= 90)).all():
+        raise HTTPException(status_code=400, detail="Polygon vertices must be within lon [-180, 180], lat [-90, 90]")
     return await create_aoi(
         name=body.name,
-        polygon_coords=body.polygon,
+        polygon_coords=coords,
         description=body.description,
         alert_vessel_types=body.alert_vessel_types,
         alert_min_risk_score=body.alert_min_risk_score,
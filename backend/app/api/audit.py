@@ -3,6 +3,7 @@
 import logging
 
 from fastapi import APIRouter, Query
+from fastapi.responses import ORJSONResponse
 
 from app.database import get_db
 
@@ -11,7 +12,7 @@ logger = logging.getLogger("poseidon.api.audit")
 router = APIRouter()
 
 
-@router.get("")
+@router.get("", response_class=ORJSONResponse)
 async def list_audit_logs(
     hours: int = Query(24, ge=1, le=720),
     path_filter: str | None = Query(None),
@@ -20,51 +21,31 @@ async def list_audit_logs(
 ):
     """Query recent audit log entries."""
     db = get_db()
-    conditions = ["created_at > NOW() - make_interval(hours => $1)"]
-    params: list = [hours]
-    idx = 2
-
-    if path_filter:
-        conditions.append(f"path ILIKE ${idx}")
-        params.append(f"%{path_filter}%")
-        idx += 1
-
-    if username:
-        conditions.append(f"username = ${idx}")
-        params.append(username)
-        idx += 1
-
-    where = " AND ".join(conditions)
 
+    # One fixed statement for every filter combination so asyncpg's
+    # per-connection statement cache reuses the parsed/planned query.
     rows = await db.fetch(
-        f"""
+        """
         SELECT id, user_id, username, method, path, status_code,
                client_ip, response_time_ms, created_at
         FROM audit_log
-        WHERE {where}
+        WHERE created_at > NOW() - make_interval(hours => $1)
+          AND ($2::text IS NULL OR path ILIKE $2)
+          AND ($3::text IS NULL OR username = $3)
         ORDER BY created_at DESC
-        LIMIT {limit}
+        LIMIT $4
         """,
-        *params,
+        hours,
+        f"%{path_filter}%" if path_filter else None,
+        username,
+        limit,
     )
 
-    return {
+    # orjson serializes datetimes natively, so rows go out as-is
+    return ORJSONResponse({
         "count": len(rows),
-        "entries": [
-            {
-                "id": r["id"],
-                "user_id": r["user_id"],
-                "username": r["username"],
-                "method": r["method"],
-                "path": r["path"],
-                "status_code": r["status_code"],
-                "client_ip": r["client_ip"],
-                "response_time_ms": r["response_time_ms"],
-                "created_at": r["created_at"].isoformat() if r["created_at"] else None,
-            }
-            for r in rows
-        ],
-    }
+        "entries": [dict(r) for r in rows],
+    })
 
 
 @router.get("/stats")
@@ -2,9 +2,10 @@
 
 import logging
 
-from fastapi import APIRouter, Query
+from fastapi import APIRouter, HTTPException, Path, Query, Request
 
-from app.services.eez_service import get_eez_events, get_eez_zones_geojson
+from app.api.response_cache import cached_json_response, cached_response
+from app.services.eez_service import get_eez_events, get_eez_tile, get_eez_zones_geojson
 
 logger = logging.getLogger("poseidon.api.eez")
 
@@ -12,10 +13,25 @@ router = APIRouter()
 
 
 @router.get("/zones")
-async def list_eez_zones():
+async def list_eez_zones(request: Request):
     """Return all EEZ zones as simplified GeoJSON."""
-    geojson = await get_eez_zones_geojson()
-    return geojson
+    return await cached_json_response(request, ("eez_zones",), get_eez_zones_geojson)
+
+
+@router.get("/tiles/{z}/{x}/{y}.pbf")
+async def eez_tile(
+    request: Request,
+    z: int = Path(..., ge=0, le=22),
+    x: int = Path(..., ge=0),
+    y: int = Path(..., ge=0),
+):
+    """Return EEZ zones as a Mapbox Vector Tile (layer 'eez')."""
+    if x >= 1 << z or y >= 1 << z:
+        raise HTTPException(status_code=400, detail=f"Tile {z}/{x}/{y} out of range")
+    return await cached_response(
+        request, ("eez_tile", z, x, y), lambda: get_eez_tile(z, x, y),
+        media_type="application/vnd.mapbox-vector-tile",
+    )
 
 
 @router.get("/events")
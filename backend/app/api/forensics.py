@@ -1,6 +1,10 @@
-from fastapi import APIRouter, Query, HTTPException
+from fastapi import APIRouter, Query, HTTPException, Request
 
-from app.services.forensics_service import get_forensic_messages, get_forensic_summary
+from app.api.pagination import decode_cursor, next_cursor
+from app.api.response_cache import conditional_json_response
+from app.services.forensics_service import (
+    get_forensic_messages, get_forensic_summary, get_forensic_summary_validator,
+)
 from app.services.assessment_service import compute_assessment
 
 router = APIRouter()
@@ -12,17 +16,31 @@ async def forensic_messages(
     hours: int = Query(24, ge=1, le=720),
     flagged_only: bool = Query(False),
     limit: int = Query(200, ge=1, le=1000),
+    cursor: str | None = Query(None, description="next_cursor from the previous page"),
 ):
-    messages = await get_forensic_messages(mmsi, hours, flagged_only, limit)
-    return {"count": len(messages), "messages": messages}
+    cursor_ts, cursor_id = decode_cursor(cursor)
+    messages = await get_forensic_messages(
+        mmsi, hours, flagged_only, limit, cursor_ts=cursor_ts, cursor_id=cursor_id,
+    )
+    return {
+        "count": len(messages),
+        "messages": messages,
+        "next_cursor": next_cursor(messages, limit, "timestamp"),
+    }
 
 
 @router.get("/summary/{mmsi}")
 async def forensic_summary(
+    request: Request,
     mmsi: int,
     hours: int = Query(24, ge=1, le=720),
 ):
-    return await get_forensic_summary(mmsi, hours)
+    validator = await get_forensic_summary_validator(mmsi, hours)
+    return await conditional_json_response(
+        request,
+        ("forensic_summary", mmsi, hours, *validator),
+        lambda: get_forensic_summary(mmsi, hours),
+    )
 
 
 @router.get("/assessment/{mmsi}")
@@ -5,17 +5,26 @@ GET  /api/v1/fusion/history/{mmsi}  -- get fusion history for a vessel
 GET  /api/v1/fusion/batch           -- compute fusion for all recently active vessels
 """
 
+import asyncio
 import logging
 
 from fastapi import APIRouter, Query, HTTPException
 
 from app.database import get_db
-from app.services.fusion_service import compute_fusion, get_fusion_history
+from app.services.fusion_service import (
+    compute_fusion,
+    compute_fusion_many,
+    get_fusion_history,
+)
 
 logger = logging.getLogger("poseidon.api.fusion")
 
 router = APIRouter()
 
+# Concurrent compute_fusion calls in the /batch per-vessel fallback; kept
+# below the asyncpg pool max_size so it cannot starve other requests.
+FUSION_BATCH_CONCURRENCY = 16
+
 
 @router.post("/compute/{mmsi}")
 async def fusion_compute(mmsi: int):
@@ -62,7 +71,7 @@ async def fusion_batch(
     try:
         rows = await db.fetch(
             """
-            SELECT DISTINCT mmsi
+            SELECT mmsi
             FROM latest_vessel_positions
             WHERE timestamp > NOW() - make_interval(hours => $1)
             """,
@@ -72,15 +81,13 @@ async def fusion_batch(
         logger.error("Fusion batch vessel query failed: %s", e)
         raise HTTPException(status_code=500, detail=str(e))
 
-    results = []
-    errors = 0
-    for row in rows:
-        try:
-            result = await compute_fusion(row["mmsi"])
-            results.append(result)
-        except Exception as e:
-            logger.warning("Fusion batch skipped MMSI %d: %s", row["mmsi"], e)
-            errors += 1
+    try:
+        results = await compute_fusion_many([r["mmsi"] for r in rows])
+    except Exception as e:
+        # Don't let one bad vessel sink the rest: redo the batch per MMSI
+        logger.warning("Fusion batch failed, retrying per vessel: %s", e)
+        results = await _compute_fusion_each(rows)
+    errors = len(rows) - len(results)
 
     logger.info(
         "Fusion batch complete: %d computed, %d errors out of %d vessels",
@@ -93,3 +100,25 @@ async def fusion_batch(
         "total_vessels": len(rows),
         "results": results,
     }
+
+
+async def _compute_fusion_each(rows) -> list[dict]:
+    """Per-MMSI fallback for fusion_batch; skips vessels that fail."""
+    sem = asyncio.Semaphore(FUSION_BATCH_CONCURRENCY)
+
+    async def _one(mmsi: int) -> dict:
+        async with sem:
+            return await compute_fusion(mmsi)
+
+    outcomes = await asyncio.gather(
+        *[_one(row["mmsi"]) for row in rows],
+        return_exceptions=True,
+    )
+
+    results = []
+    for row, outcome in zip(rows, outcomes):
+        if isinstance(outcome, Exception):
+            logger.warning("Fusion batch skipped MMSI %d: %s", row["mmsi"], outcome)
+        else:
+            results.append(outcome)
+    return results
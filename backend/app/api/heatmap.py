@@ -1,38 +1,48 @@
 from fastapi import APIRouter, Query
+from fastapi.responses import ORJSONResponse
 
+from app.api.pagination import decode_cursor, next_cursor
 from app.database import get_db
 
 router = APIRouter()
 
 
-@router.get("/spoof")
+@router.get("/spoof", response_class=ORJSONResponse)
 async def spoof_heatmap(
     hours: int = Query(24, ge=1, le=720),
+    cursor: str | None = Query(None, description="next_cursor from the previous page"),
+    page_size: int = Query(500, ge=1, le=5000),
 ):
-    """Return spoof signal points for frontend heatmap rendering."""
+    """Return one page of spoof signal points for frontend heatmap rendering."""
+    cursor_ts, cursor_id = decode_cursor(cursor)
+    # Separate statement texts for the first and later pages: a shared
+    # "$n IS NULL OR (ts, id) < ..." predicate stops being an index
+    # condition once Postgres switches the cached statement to a generic plan
+    args = [hours, page_size]
+    keyset = ""
+    if cursor_ts is not None:
+        keyset = "AND (detected_at, id) < ($3, $4)"
+        args += [cursor_ts, cursor_id]
+
     db = get_db()
     async with db.acquire() as conn:
         rows = await conn.fetch(
-            """
-            SELECT ST_X(geom) AS lon, ST_Y(geom) AS lat,
-                   anomaly_type::text AS anomaly_type
+            f"""
+            SELECT id, detected_at,
+                   ST_X(geom) AS lon, ST_Y(geom) AS lat,
+                   anomaly_type::text AS anomaly_type,
+                   1 AS weight
             FROM spoof_signals
             WHERE detected_at > NOW() - make_interval(hours => $1)
-            ORDER BY detected_at DESC
-            LIMIT 10000
+              {keyset}
+            ORDER BY detected_at DESC, id DESC
+            LIMIT $2
             """,
-            hours,
+            *args,
         )
 
-    return {
+    return ORJSONResponse({
         "count": len(rows),
-        "points": [
-            {
-                "lon": float(r["lon"]),
-                "lat": float(r["lat"]),
-                "anomaly_type": r["anomaly_type"],
-                "weight": 1,
-            }
-            for r in rows
-        ],
-    }
+        "points": [dict(r) for r in rows],
+        "next_cursor": next_cursor(rows, page_size, "detected_at"),
+    })
@@ -1,15 +1,18 @@
 import os
 import logging
 
-from fastapi import APIRouter, Query, HTTPException, BackgroundTasks
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, Query, HTTPException, BackgroundTasks, Depends
+from fastapi.responses import FileResponse, Response
 
+from app.api._deps import BBox, parse_bbox
+from app.api._files import file_stat
 from app.services.sentinel2_service import (
     search_optical_scenes,
     download_optical_scene,
     get_optical_scenes,
 )
 from app.processors.timelapse import generate_timelapse
+from app.config import settings
 from app.database import get_db
 
 logger = logging.getLogger("poseidon.api.optical")
@@ -44,16 +47,10 @@ async def optical_search(
 
 @router.get("/scenes")
 async def list_scenes(
-    min_lon: float | None = Query(None),
-    min_lat: float | None = Query(None),
-    max_lon: float | None = Query(None),
-    max_lat: float | None = Query(None),
+    bbox: BBox | None = Depends(parse_bbox),
     status: str | None = Query(None),
 ):
     """List optical scenes stored in the database."""
-    bbox = None
-    if all(v is not None for v in [min_lon, min_lat, max_lon, max_lat]):
-        bbox = (min_lon, min_lat, max_lon, max_lat)
     scenes = await get_optical_scenes(bbox=bbox, status=status)
     return {"count": len(scenes), "scenes": scenes}
 
@@ -162,11 +159,25 @@ async def download_timelapse(job_id: int):
         )
 
     output_path = row["output_path"]
-    if not output_path or not os.path.exists(output_path):
+    stat = await file_stat(output_path)
+    if stat is None:
         raise HTTPException(status_code=404, detail="Timelapse MP4 file not found on disk")
 
+    filename = f"timelapse_{job_id}.mp4"
+    if settings.timelapse_accel_redirect_prefix:
+        # Nginx serves the file itself (sendfile), keeping MP4 bytes out of Python
+        return Response(
+            status_code=200,
+            media_type="video/mp4",
+            headers={
+                "X-Accel-Redirect": settings.timelapse_accel_redirect_prefix + os.path.basename(output_path),
+                "Content-Disposition": f'attachment; filename="{filename}"',
+            },
+        )
+
     return FileResponse(
         path=output_path,
         media_type="video/mp4",
-        filename=f"timelapse_{job_id}.mp4",
+        filename=filename,
+        stat_result=stat,
     )
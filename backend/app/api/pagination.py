@@ -0,0 +1,37 @@
+"""Opaque keyset-pagination cursors.
+
+A cursor encodes the (timestamp, id) of the last row on a page; the next
+page is fetched with `WHERE (ts, id) < ($cursor_ts, $cursor_id)` so deep
+pages cost the same as the first one.
+"""
+
+import base64
+import binascii
+from datetime import datetime
+
+from fastapi import HTTPException
+
+
+def encode_cursor(ts: datetime | str, row_id: int) -> str:
+    ts_str = ts if isinstance(ts, str) else ts.isoformat()
+    raw = f"{ts_str}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def decode_cursor(cursor: str | None) -> tuple[datetime | None, int | None]:
+    """Decode a cursor into (timestamp, id); (None, None) for the first page."""
+    if not cursor:
+        return None, None
+    try:
+        ts_str, id_str = base64.urlsafe_b64decode(cursor.encode()).decode().split("|", 1)
+        return datetime.fromisoformat(ts_str), int(id_str)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def next_cursor(rows: list, page_size: int, ts_key: str, id_key: str = "id") -> str | None:
+    """Cursor for the page after `rows`, or None if this was the last page."""
+    if len(rows) < page_size:
+        return None
+    last = rows[-1]
+    return encode_cursor(last[ts_key], last[id_key])
@@ -2,8 +2,10 @@
 
 import logging
 
-from fastapi import APIRouter, Query, HTTPException
+from fastapi import APIRouter, Query, HTTPException, Request, Depends
 
+from app.api._deps import BBox, parse_bbox
+from app.api.response_cache import cached_json_response
 from app.services.port_service import get_ports, get_ports_geojson, get_port_detail
 
 logger = logging.getLogger("poseidon.api.ports")
@@ -13,34 +15,25 @@ router = APIRouter()
 
 @router.get("")
 async def list_ports(
-    min_lon: float | None = Query(None),
-    min_lat: float | None = Query(None),
-    max_lon: float | None = Query(None),
-    max_lat: float | None = Query(None),
+    bbox: BBox | None = Depends(parse_bbox),
     country: str | None = Query(None),
     name: str | None = Query(None),
     limit: int = Query(500, ge=1, le=2000),
 ):
     """List ports with optional bbox, country, and name filters."""
-    bbox = None
-    if all(v is not None for v in [min_lon, min_lat, max_lon, max_lat]):
-        bbox = (min_lon, min_lat, max_lon, max_lat)
     ports = await get_ports(bbox=bbox, country_code=country, name_search=name, limit=limit)
     return {"count": len(ports), "ports": ports}
 
 
 @router.get("/geojson")
 async def ports_geojson(
-    min_lon: float | None = Query(None),
-    min_lat: float | None = Query(None),
-    max_lon: float | None = Query(None),
-    max_lat: float | None = Query(None),
+    request: Request,
+    bbox: BBox | None = Depends(parse_bbox),
 ):
     """Return ports as GeoJSON FeatureCollection."""
-    bbox = None
-    if all(v is not None for v in [min_lon, min_lat, max_lon, max_lat]):
-        bbox = (min_lon, min_lat, max_lon, max_lat)
-    return await get_ports_geojson(bbox=bbox)
+    return await cached_json_response(
+        request, ("ports_geojson", bbox), lambda: get_ports_geojson(bbox=bbox),
+    )
 
 
 @router.get("/{locode}")
@@ -7,8 +7,9 @@ and retrieving frame data for historical vessel movement playback.
 
 import logging
 
-from fastapi import APIRouter, Query, HTTPException
+from fastapi import APIRouter, Query, HTTPException, Depends
 
+from app.api._deps import BBox, parse_bbox
 from app.services.replay_service import (
     create_replay_job,
     get_replay_data,
@@ -23,10 +24,7 @@ router = APIRouter()
 @router.post("/create")
 async def create_replay(
     mmsi: int | None = Query(None, description="Optional MMSI to filter single vessel"),
-    min_lon: float | None = Query(None, description="Bounding box minimum longitude"),
-    min_lat: float | None = Query(None, description="Bounding box minimum latitude"),
-    max_lon: float | None = Query(None, description="Bounding box maximum longitude"),
-    max_lat: float | None = Query(None, description="Bounding box maximum latitude"),
+    bbox: BBox | None = Depends(parse_bbox),
     start_time: str = Query(..., description="Replay start time (ISO 8601)"),
     end_time: str = Query(..., description="Replay end time (ISO 8601)"),
     speed: float = Query(10, ge=1, le=100, description="Playback speed multiplier"),
@@ -36,11 +34,6 @@ async def create_replay(
     Specify a time range and optionally filter by MMSI or bounding box.
     The returned job_id can be used to fetch frame data for animation.
     """
-    # Build bbox if all coordinates provided
-    bbox = None
-    if all(v is not None for v in [min_lon, min_lat, max_lon, max_lat]):
-        bbox = (min_lon, min_lat, max_lon, max_lat)
-
     try:
         job_id = await create_replay_job(
             mmsi=mmsi,
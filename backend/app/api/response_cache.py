@@ -0,0 +1,172 @@
+"""In-process TTL/LRU cache for large, rarely-changing responses.
+
+Cached bodies are stored pre-serialized together with a strong ETag so a
+hit skips both the database work and JSON encoding, and clients that send
+a matching If-None-Match receive a bodiless 304.
+
+Keys are tuples whose first element names a namespace. Each namespace
+has its own bounded LRU, and TABLE_NAMESPACES maps source tables to the
+namespaces built from them so a NOTIFY from the database can drop
+exactly the entries that went stale.
+"""
+
+import asyncio
+import hashlib
+import logging
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable
+
+import asyncpg
+import orjson
+from fastapi import Request, Response
+
+from app.config import settings
+
+logger = logging.getLogger("poseidon.api.response_cache")
+
+DEFAULT_TTL_SECONDS = 300
+MAX_ENTRIES = 256  # per namespace unless overridden below
+
+# Each namespace gets its own LRU so high-churn keys (map tiles while
+# panning) can't evict the few large, expensive bodies (EEZ GeoJSON)
+NAMESPACE_MAX_ENTRIES: dict[Hashable, int] = {
+    "eez_tile": 1024,
+}
+
+INVALIDATE_CHANNEL = "poseidon_invalidate"
+RECONNECT_DELAY = 10  # seconds
+
+# table -> cache key namespaces derived from it
+TABLE_NAMESPACES: dict[str, tuple[str, ...]] = {
+    "eez_zones": ("eez_zones", "eez_tile"),
+    "ports": ("ports_geojson",),
+}
+
+# namespace -> key -> (expires_at, etag, body)
+_caches: dict[Hashable, OrderedDict[Hashable, tuple[float, str, bytes]]] = {}
+
+
+def _namespace(key: Hashable) -> Hashable:
+    return key[0] if isinstance(key, tuple) and key else key
+
+
+def _lookup(key: Hashable) -> tuple[str, bytes] | None:
+    cache = _caches.get(_namespace(key))
+    entry = cache.get(key) if cache is not None else None
+    if entry is None:
+        return None
+    expires_at, etag, body = entry
+    if expires_at < time.monotonic():
+        del cache[key]
+        return None
+    cache.move_to_end(key)
+    return etag, body
+
+
+def _store(key: Hashable, body: bytes, ttl: int) -> str:
+    etag = '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+    namespace = _namespace(key)
+    cache = _caches.setdefault(namespace, OrderedDict())
+    cache[key] = (time.monotonic() + ttl, etag, body)
+    cache.move_to_end(key)
+    max_entries = NAMESPACE_MAX_ENTRIES.get(namespace, MAX_ENTRIES)
+    while len(cache) > max_entries:
+        cache.popitem(last=False)
+    return etag
+
+
+async def cached_response(
+    request: Request,
+    key: Hashable,
+    build: Callable[[], Awaitable[bytes]],
+    media_type: str,
+    ttl: int = DEFAULT_TTL_SECONDS,
+) -> Response:
+    """Serve the bytes produced by `build()` from cache, honouring If-None-Match."""
+    hit = _lookup(key)
+    if hit is None:
+        body = await build()
+        etag = _store(key, body, ttl)
+    else:
+        etag, body = hit
+
+    headers = {"ETag": etag, "Cache-Control": f"public, max-age={ttl}"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type=media_type, headers=headers)
+
+
+async def cached_json_response(
+    request: Request,
+    key: Hashable,
+    build: Callable[[], Awaitable[Any]],
+    ttl: int = DEFAULT_TTL_SECONDS,
+) -> Response:
+    """Serve `build()`'s JSON result from cache, honouring If-None-Match."""
+
+    async def _build_json() -> bytes:
+        return orjson.dumps(await build())
+
+    return await cached_response(request, key, _build_json, "application/json", ttl)
+
+
+async def conditional_json_response(
+    request: Request,
+    validator: Hashable,
+    build: Callable[[], Awaitable[Any]],
+    max_age: int = 30,
+) -> Response:
+    """Answer 304 when the client's copy matches `validator`, else JSON from `build()`.
+
+    `validator` must be cheap to compute and change whenever `build()`'s
+    result would; it becomes a weak ETag.
+    """
+    etag = 'W/"' + hashlib.blake2b(repr(validator).encode(), digest_size=16).hexdigest() + '"'
+    headers = {"ETag": etag, "Cache-Control": f"public, max-age={max_age}"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+
+    body = orjson.dumps(await build())
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def invalidate(table: str) -> int:
+    """Drop every cached entry derived from `table`; returns how many."""
+    namespaces = TABLE_NAMESPACES.get(table)
+    if not namespaces:
+        return 0
+    return sum(len(_caches.pop(ns, ())) for ns in namespaces)
+
+
+def _on_notify(conn, pid, channel, payload) -> None:
+    dropped = invalidate(payload)
+    logger.info("Cache invalidated for %s (%d entries)", payload, dropped)
+
+
+async def run_cache_invalidation_listener() -> None:
+    """Background task: LISTEN for table-change notifications.
+
+    Uses its own connection rather than a pool slot, since LISTEN pins the
+    connection for the lifetime of the process.
+    """
+    logger.info("Cache invalidation listener starting (channel=%s)", INVALIDATE_CHANNEL)
+
+    while True:
+        conn = None
+        try:
+            conn = await asyncpg.connect(dsn=settings.database_url)
+            await conn.add_listener(INVALIDATE_CHANNEL, _on_notify)
+            # Anything cached while we were disconnected may be stale
+            _caches.clear()
+            while not conn.is_closed():
+                await asyncio.sleep(RECONNECT_DELAY)
+            logger.warning("Cache invalidation listener connection lost")
+        except asyncio.CancelledError:
+            logger.info("Cache invalidation listener cancelled")
+            if conn is not None:
+                await conn.close()
+            return
+        except Exception as e:
+            logger.error("Cache invalidation listener error: %s", e)
+        await asyncio.sleep(RECONNECT_DELAY)
@@ -8,15 +8,17 @@ scores, listing high-risk vessels, and generating PDF reports.
 import os
 import logging
 
-from fastapi import APIRouter, Query, HTTPException
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, Query, HTTPException, Request, Response
+from fastapi.responses import FileResponse, ORJSONResponse
+
+from app.api._files import file_etag, file_stat
 
 from app.services.risk_scoring import (
     compute_risk_score,
     get_risk_score,
     get_high_risk_vessels,
 )
-from app.services.report_service import generate_vessel_report
+from app.services.report_service import get_or_generate_vessel_report
 
 logger = logging.getLogger("poseidon.api.risk")
 
@@ -60,7 +62,7 @@ async def get_vessel_risk_score(mmsi: int):
     return result
 
 
-@router.get("/high-risk")
+@router.get("/high-risk", response_class=ORJSONResponse)
 async def list_high_risk_vessels(
     threshold: float = Query(50, ge=0, le=100, description="Minimum risk score threshold"),
 ):
@@ -71,31 +73,37 @@ async def list_high_risk_vessels(
         logger.error("Failed to fetch high-risk vessels: %s", e)
         raise HTTPException(status_code=500, detail=f"Failed to fetch high-risk vessels: {str(e)}")
 
-    return {"threshold": threshold, "count": len(vessels), "vessels": vessels}
+    return ORJSONResponse({"threshold": threshold, "count": len(vessels), "vessels": vessels})
 
 
 @router.get("/report/{mmsi}")
-async def download_vessel_report(mmsi: int):
+async def download_vessel_report(request: Request, mmsi: int):
     """Generate and download a PDF intelligence report for a vessel.
 
     Produces a comprehensive report including vessel identity, risk assessment,
     track summary, dark activity, and SAR detections.
     """
     try:
-        filepath = await generate_vessel_report(mmsi)
+        filepath = await get_or_generate_vessel_report(mmsi)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
     except Exception as e:
         logger.error("Report generation failed for MMSI %d: %s", mmsi, e)
         raise HTTPException(status_code=500, detail=f"Report generation failed: {str(e)}")
 
-    if not os.path.exists(filepath):
+    stat = await file_stat(filepath)
+    if stat is None:
         raise HTTPException(status_code=500, detail="Report file was not created")
 
+    headers = {"ETag": file_etag(stat), "Cache-Control": "private, max-age=60"}
+    if request.headers.get("if-none-match") == headers["ETag"]:
+        return Response(status_code=304, headers=headers)
+
     filename = os.path.basename(filepath)
     return FileResponse(
         path=filepath,
         media_type="application/pdf",
         filename=filename,
-        headers={"Content-Disposition": f"attachment; filename={filename}"},
+        headers={**headers, "Content-Disposition": f"attachment; filename={filename}"},
+        stat_result=stat,
     )
@@ -8,6 +8,7 @@ stored predictions.
 import logging
 
 from fastapi import APIRouter, Query, HTTPException
+from fastapi.responses import ORJSONResponse
 
 from app.services.route_prediction import predict_route, get_predictions
 
@@ -38,7 +39,7 @@ async def predict_vessel_route(
     return result
 
 
-@router.get("/predictions/{mmsi}")
+@router.get("/predictions/{mmsi}", response_class=ORJSONResponse)
 async def get_vessel_predictions(
     mmsi: int,
     limit: int = Query(5, ge=1, le=50, description="Max predictions to return"),
@@ -50,4 +51,4 @@ async def get_vessel_predictions(
         logger.error("Failed to fetch predictions for MMSI %d: %s", mmsi, e)
         raise HTTPException(status_code=500, detail=f"Failed to fetch predictions: {str(e)}")
 
-    return {"mmsi": mmsi, "count": len(predictions), "predictions": predictions}
+    return ORJSONResponse({"mmsi": mmsi, "count": len(predictions), "predictions": predictions})
@@ -1,7 +1,11 @@
 import asyncio
 import logging
 
-from fastapi import APIRouter, Query, HTTPException, BackgroundTasks
+from fastapi import APIRouter, Query, HTTPException, BackgroundTasks, Depends
+from fastapi.responses import ORJSONResponse
+
+from app.api._deps import BBox, parse_bbox
+from app.config import settings
 
 from app.services.sar_service import (
     search_scenes,
@@ -17,6 +21,10 @@ logger = logging.getLogger("poseidon.api.sar")
 
 router = APIRouter()
 
+# Bounds concurrent scene pipelines; extra requests queue here instead of
+# competing for Copernicus bandwidth, disk and CPU
+_processing_slots = asyncio.Semaphore(settings.sar_max_concurrent_processing)
+
 
 @router.post("/search")
 async def sar_search(
@@ -38,20 +46,14 @@ async def sar_search(
     return {"count": len(scenes), "scenes": scenes}
 
 
-@router.get("/scenes")
+@router.get("/scenes", response_class=ORJSONResponse)
 async def list_scenes(
-    min_lon: float | None = Query(None),
-    min_lat: float | None = Query(None),
-    max_lon: float | None = Query(None),
-    max_lat: float | None = Query(None),
+    bbox: BBox | None = Depends(parse_bbox),
     status: str | None = Query(None),
 ):
     """List SAR scenes stored in the database."""
-    bbox = None
-    if all(v is not None for v in [min_lon, min_lat, max_lon, max_lat]):
-        bbox = (min_lon, min_lat, max_lon, max_lat)
     scenes = await get_scenes(bbox=bbox, status=status)
-    return {"count": len(scenes), "scenes": scenes}
+    return ORJSONResponse({"count": len(scenes), "scenes": scenes})
 
 
 @router.post("/scenes/{scene_db_id}/process")
@@ -59,50 +61,39 @@ async def process_sar_scene(scene_db_id: int, background_tasks: BackgroundTasks)
     """Trigger download + CFAR processing for a specific scene."""
 
     async def _download_and_process(sid: int):
-        try:
-            await download_scene(sid)
-            count = await process_scene(sid)
-            await match_detections_to_ais(sid)
-            logger.info("Scene %d fully processed: %d detections", sid, count)
-        except Exception as e:
-            logger.error("Scene %d processing pipeline failed: %s", sid, e)
+        async with _processing_slots:
+            try:
+                await download_scene(sid)
+                count = await process_scene(sid)
+                await match_detections_to_ais(sid)
+                logger.info("Scene %d fully processed: %d detections", sid, count)
+            except Exception as e:
+                logger.error("Scene %d processing pipeline failed: %s", sid, e)
 
     background_tasks.add_task(_download_and_process, scene_db_id)
     return {"status": "processing", "scene_id": scene_db_id}
 
 
-@router.get("/detections")
+@router.get("/detections", response_class=ORJSONResponse)
 async def list_detections(
     scene_id: int | None = Query(None),
-    min_lon: float | None = Query(None),
-    min_lat: float | None = Query(None),
-    max_lon: float | None = Query(None),
-    max_lat: float | None = Query(None),
+    bbox: BBox | None = Depends(parse_bbox),
     unmatched_only: bool = Query(False),
 ):
     """List SAR detections with optional filters."""
-    bbox = None
-    if all(v is not None for v in [min_lon, min_lat, max_lon, max_lat]):
-        bbox = (min_lon, min_lat, max_lon, max_lat)
     detections = await get_detections(
         scene_id=scene_id, bbox=bbox, unmatched_only=unmatched_only
     )
-    return {"count": len(detections), "detections": detections}
+    return ORJSONResponse({"count": len(detections), "detections": detections})
 
 
-@router.get("/ghost-vessels")
+@router.get("/ghost-vessels", response_class=ORJSONResponse)
 async def list_ghost_vessels(
-    min_lon: float | None = Query(None),
-    min_lat: float | None = Query(None),
-    max_lon: float | None = Query(None),
-    max_lat: float | None = Query(None),
+    bbox: BBox | None = Depends(parse_bbox),
 ):
     """List unmatched SAR detections (ghost vessels)."""
-    bbox = None
-    if all(v is not None for v in [min_lon, min_lat, max_lon, max_lat]):
-        bbox = (min_lon, min_lat, max_lon, max_lat)
     ghosts = await get_ghost_vessels(bbox=bbox)
-    return {"count": len(ghosts), "ghost_vessels": ghosts}
+    return ORJSONResponse({"count": len(ghosts), "ghost_vessels": ghosts})
 
 
 @router.post("/scenes/{scene_db_id}/kelvin-wakes")
@@ -115,15 +106,9 @@ async def extract_wakes(scene_db_id: int, background_tasks: BackgroundTasks):
 @router.get("/kelvin-wakes")
 async def list_kelvin_wakes(
     scene_id: int | None = Query(None),
-    min_lon: float | None = Query(None),
-    min_lat: float | None = Query(None),
-    max_lon: float | None = Query(None),
-    max_lat: float | None = Query(None),
+    bbox: BBox | None = Depends(parse_bbox),
     limit: int = Query(200, ge=1, le=1000),
 ):
     """List Kelvin wake detections."""
-    bbox = None
-    if all(v is not None for v in [min_lon, min_lat, max_lon, max_lat]):
-        bbox = (min_lon, min_lat, max_lon, max_lat)
     wakes = await get_kelvin_wakes(scene_id=scene_id, bbox=bbox, limit=limit)
     return {"count": len(wakes), "wakes": wakes}
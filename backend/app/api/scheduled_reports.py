@@ -1,12 +1,15 @@
 """Scheduled reports REST endpoints."""
 
+import asyncio
 import os
 import logging
 
 from fastapi import APIRouter, Query, HTTPException, BackgroundTasks
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse
 from pydantic import BaseModel, Field
 
+from app.api._files import file_stat
+from app.config import settings
 from app.database import get_db
 from app.services.scheduled_report_service import (
     get_scheduled_reports,
@@ -19,6 +22,9 @@ logger = logging.getLogger("poseidon.api.scheduled_reports")
 
 router = APIRouter()
 
+# PDF generation is memory-heavy; queue on-demand runs beyond this many
+_generation_slots = asyncio.Semaphore(settings.report_max_concurrent_generation)
+
 
 class CreateReportRequest(BaseModel):
     name: str
@@ -29,11 +35,11 @@ class CreateReportRequest(BaseModel):
     model_config = {"populate_by_name": True}
 
 
-@router.get("")
+@router.get("", response_class=ORJSONResponse)
 async def list_reports():
     """List all scheduled reports."""
     reports = await get_scheduled_reports()
-    return {"count": len(reports), "reports": reports}
+    return ORJSONResponse({"count": len(reports), "reports": reports})
 
 
 @router.post("")
@@ -53,27 +59,27 @@ async def run_report_now(report_id: int, background_tasks: BackgroundTasks):
     """Trigger immediate generation of a scheduled report."""
     db = get_db()
 
-    report = await db.fetchrow("SELECT id FROM scheduled_reports WHERE id = $1", report_id)
-    if not report:
-        raise HTTPException(status_code=404, detail=f"Report {report_id} not found")
-
+    # Existence check and insert in one round-trip; no row back means no report
     output_row = await db.fetchrow(
         """
         INSERT INTO scheduled_report_outputs (report_id, status)
-        VALUES ($1, 'generating')
+        SELECT id, 'generating' FROM scheduled_reports WHERE id = $1
         RETURNING id
         """,
         report_id,
     )
+    if not output_row:
+        raise HTTPException(status_code=404, detail=f"Report {report_id} not found")
 
     async def _run_digest(rid: int, oid: int):
-        try:
-            await generate_digest(rid, oid)
-        except Exception as e:
-            logger.error("Report generation failed for report %d: %s", rid, e)
-            await db.execute(
-                "UPDATE scheduled_report_outputs SET status = 'failed' WHERE id = $1", oid
-            )
+        async with _generation_slots:
+            try:
+                await generate_digest(rid, oid)
+            except Exception as e:
+                logger.error("Report generation failed for report %d: %s", rid, e)
+                await db.execute(
+                    "UPDATE scheduled_report_outputs SET status = 'failed' WHERE id = $1", oid
+                )
 
     background_tasks.add_task(_run_digest, report_id, output_row["id"])
     return {"status": "generating", "output_id": output_row["id"]}
@@ -100,13 +106,15 @@ async def download_report_output(output_id: int):
     if row["status"] != "completed":
         raise HTTPException(status_code=409, detail=f"Report not completed (status: {row['status']})")
 
-    if not row["pdf_path"] or not os.path.exists(row["pdf_path"]):
+    stat = await file_stat(row["pdf_path"])
+    if stat is None:
         raise HTTPException(status_code=404, detail="PDF file not found")
 
     return FileResponse(
         path=row["pdf_path"],
         media_type="application/pdf",
         filename=os.path.basename(row["pdf_path"]),
+        stat_result=stat,
     )
 
 
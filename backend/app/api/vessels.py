@@ -1,14 +1,19 @@
+import asyncio
 import math
+import os
 from datetime import datetime, timezone
 
-from fastapi import APIRouter, Query, HTTPException
-from fastapi.responses import FileResponse
+from fastapi import APIRouter, Query, HTTPException, Depends, Request, Response
+from fastapi.responses import FileResponse, ORJSONResponse
+
+from app.api._deps import BBox, parse_bbox
+from app.api._files import file_etag, file_stat
 
 from app.services.vessel_service import get_all_vessels, get_vessel_detail
 from app.services.history_service import get_mmsi_history
-from app.services.sanctions_service import screen_vessel
+from app.services.sanctions_service import get_cached_screening, screen_vessel
 from app.services.equasis_service import lookup_vessel
-from app.services.report_service import generate_vessel_report
+from app.services.report_service import get_or_generate_vessel_report
 
 router = APIRouter()
 
@@ -92,27 +97,22 @@ _CLASS_SOCIETIES = [
 ]
 
 # Ship type text → generic owner name patterns
-_OWNER_PATTERNS: dict[str, list[str]] = {
-    "Tanker": ["Tanker Corp", "Petroship SA", "Energy Marine Ltd", "Gulf Tankers Inc"],
-    "Cargo": ["Bulk Carriers Inc", "Global Freight Lines", "Pacific Cargo Ltd", "Atlantic Shipping Co"],
-    "Container Ship": ["Container Lines Ltd", "Box Ship Corp", "Intermodal Marine SA", "Pacific Container Co"],
-    "Passenger": ["Cruise Holdings Ltd", "Star Ferries Inc", "Ocean Voyages SA", "Maritime Leisure Group"],
-    "Fishing": ["Deep Sea Fisheries Co", "Pacific Trawlers Ltd", "North Atlantic Fishing SA"],
-    "Tug": ["Harbor Services Inc", "Marine Assist Ltd", "Port Tug Operations Co"],
+_OWNER_PATTERNS: dict[str, tuple[str, ...]] = {
+    "Tanker": ("Tanker Corp", "Petroship SA", "Energy Marine Ltd", "Gulf Tankers Inc"),
+    "Cargo": ("Bulk Carriers Inc", "Global Freight Lines", "Pacific Cargo Ltd", "Atlantic Shipping Co"),
+    "Container Ship": ("Container Lines Ltd", "Box Ship Corp", "Intermodal Marine SA", "Pacific Container Co"),
+    "Passenger": ("Cruise Holdings Ltd", "Star Ferries Inc", "Ocean Voyages SA", "Maritime Leisure Group"),
+    "Fishing": ("Deep Sea Fisheries Co", "Pacific Trawlers Ltd", "North Atlantic Fishing SA"),
+    "Tug": ("Harbor Services Inc", "Marine Assist Ltd", "Port Tug Operations Co"),
 }
 
+# Unlisted ship types (including "Unknown") fall back to cargo owners
+_DEFAULT_OWNERS = _OWNER_PATTERNS["Cargo"]
+
 
 def _flag_from_mmsi(mmsi: int) -> str | None:
     """Derive flag state from MMSI Maritime Identification Digits."""
-    mid = mmsi // 1_000_000
-    if mid in _MID_FLAG:
-        return _MID_FLAG[mid]
-    # Try 3-digit MID for some ranges
-    mid3 = mmsi // 100_000
-    if 2010 <= mid3 <= 7759:
-        mid3_lookup = mid3 // 10
-        return _MID_FLAG.get(mid3_lookup)
-    return None
+    return _MID_FLAG.get(mmsi // 1_000_000)
 
 
 def _estimate_tonnage(dim_bow, dim_stern, dim_port, dim_starboard) -> dict:
@@ -144,14 +144,13 @@ def _build_ais_registry(vessel: dict) -> dict:
     # Deterministic pseudo-random selections based on MMSI
     seed = mmsi % 100
     cs_idx = seed % len(_CLASS_SOCIETIES)
-    owners = _OWNER_PATTERNS.get(ship_type, _OWNER_PATTERNS.get("Cargo", []))
-    owner_idx = seed % len(owners) if owners else 0
+    owners = _OWNER_PATTERNS.get(ship_type, _DEFAULT_OWNERS)
     year_built = 1995 + (seed % 30)  # 1995-2024 range
 
     return {
         "vessel_name": vessel.get("name"),
         "flag_state": flag_state,
-        "registered_owner": owners[owner_idx] if owners else None,
+        "registered_owner": owners[seed % len(owners)],
         "operator": None,
         "class_society": _CLASS_SOCIETIES[cs_idx],
         "year_built": year_built,
@@ -163,20 +162,13 @@ def _build_ais_registry(vessel: dict) -> dict:
     }
 
 
-@router.get("")
+@router.get("", response_class=ORJSONResponse)
 async def list_vessels(
-    min_lon: float | None = Query(None),
-    min_lat: float | None = Query(None),
-    max_lon: float | None = Query(None),
-    max_lat: float | None = Query(None),
+    bbox: BBox | None = Depends(parse_bbox),
     name: str | None = Query(None),
 ):
-    bbox = None
-    if all(v is not None for v in [min_lon, min_lat, max_lon, max_lat]):
-        bbox = (min_lon, min_lat, max_lon, max_lat)
-
     vessels = await get_all_vessels(bbox=bbox, name_search=name)
-    return {"count": len(vessels), "vessels": vessels}
+    return ORJSONResponse({"count": len(vessels), "vessels": vessels})
 
 
 @router.get("/{mmsi}")
@@ -198,14 +190,24 @@ async def vessel_history(mmsi: int):
 @router.get("/{mmsi}/sanctions")
 async def vessel_sanctions(mmsi: int, force: bool = Query(False)):
     """Screen vessel against OpenSanctions database."""
-    vessel = await get_vessel_detail(mmsi)
+    # The sanctions cache is keyed by MMSI, so it can be read alongside the
+    # vessel lookup instead of after it
+    if force:
+        vessel, cached = await get_vessel_detail(mmsi), None
+    else:
+        vessel, cached = await asyncio.gather(
+            get_vessel_detail(mmsi), get_cached_screening(mmsi=mmsi),
+        )
     if not vessel:
         raise HTTPException(status_code=404, detail="Vessel not found")
+    if cached is not None:
+        cached["imo"] = vessel.get("imo")
+        return cached
     return await screen_vessel(
         mmsi=mmsi,
         imo=vessel.get("imo"),
         name=vessel.get("name"),
-        force_refresh=force,
+        force_refresh=True,
     )
 
 
@@ -244,14 +246,24 @@ async def vessel_equasis(mmsi: int, force: bool = Query(False)):
 
 
 @router.get("/{mmsi}/report")
-async def vessel_report(mmsi: int):
+async def vessel_report(request: Request, mmsi: int):
     """Generate and return a PDF intelligence report for this vessel."""
     try:
-        filepath = await generate_vessel_report(mmsi)
+        filepath = await get_or_generate_vessel_report(mmsi)
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
+    stat = await file_stat(filepath)
+    if stat is None:
+        raise HTTPException(status_code=500, detail="Report file was not created")
+
+    headers = {"ETag": file_etag(stat), "Cache-Control": "private, max-age=60"}
+    if request.headers.get("if-none-match") == headers["ETag"]:
+        return Response(status_code=304, headers=headers)
+
     return FileResponse(
         filepath,
         media_type="application/pdf",
-        filename=filepath.rsplit("/", 1)[-1],
+        filename=os.path.basename(filepath),
+        headers=headers,
+        stat_result=stat,
     )
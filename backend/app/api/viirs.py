@@ -8,7 +8,9 @@ GET  /api/v1/viirs/anomalies     — list anomalies (bbox filter)
 import logging
 from datetime import date
 
-from fastapi import APIRouter, Query, HTTPException, BackgroundTasks
+from fastapi import APIRouter, Query, HTTPException, BackgroundTasks, Depends
+
+from app.api._deps import BBox, parse_bbox
 
 from app.services.viirs_service import (
     fetch_viirs_data,
@@ -25,19 +27,13 @@ router = APIRouter()
 @router.post("/fetch")
 async def viirs_fetch(
     background_tasks: BackgroundTasks,
-    min_lon: float | None = Query(None),
-    min_lat: float | None = Query(None),
-    max_lon: float | None = Query(None),
-    max_lat: float | None = Query(None),
+    bbox: BBox | None = Depends(parse_bbox),
     days: int = Query(1, ge=1, le=10),
 ):
     """Manually trigger VIIRS data fetch. Optionally filter by bbox.
 
     Fetch runs in the background; returns immediately with status.
     """
-    bbox = None
-    if all(v is not None for v in [min_lon, min_lat, max_lon, max_lat]):
-        bbox = (min_lon, min_lat, max_lon, max_lat)
 
     async def _fetch_and_detect():
         try:
@@ -55,17 +51,10 @@ async def viirs_fetch(
 
 @router.get("/observations")
 async def list_observations(
-    min_lon: float | None = Query(None),
-    min_lat: float | None = Query(None),
-    max_lon: float | None = Query(None),
-    max_lat: float | None = Query(None),
+    bbox: BBox | None = Depends(parse_bbox),
     date: date | None = Query(None, description="YYYY-MM-DD"),
 ):
     """List VIIRS observations with optional bbox and date filters."""
-    bbox = None
-    if all(v is not None for v in [min_lon, min_lat, max_lon, max_lat]):
-        bbox = (min_lon, min_lat, max_lon, max_lat)
-
     try:
         observations = await get_viirs_observations(bbox=bbox, obs_date=date)
     except Exception as e:
@@ -77,16 +66,9 @@ async def list_observations(
 
 @router.get("/anomalies")
 async def list_anomalies(
-    min_lon: float | None = Query(None),
-    min_lat: float | None = Query(None),
-    max_lon: float | None = Query(None),
-    max_lat: float | None = Query(None),
+    bbox: BBox | None = Depends(parse_bbox),
 ):
     """List VIIRS brightness anomalies with optional bbox filter."""
-    bbox = None
-    if all(v is not None for v in [min_lon, min_lat, max_lon, max_lat]):
-        bbox = (min_lon, min_lat, max_lon, max_lat)
-
     try:
         anomalies = await get_viirs_anomalies(bbox=bbox)
     except Exception as e:
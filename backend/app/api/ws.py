@@ -1,45 +1,127 @@
 import asyncio
-import json
 import logging
 
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
-import redis.asyncio as aioredis
 
 from app.database import get_redis
+from app.ingestors.ais_stream import LIVE_STREAM
 
 logger = logging.getLogger("poseidon.ws")
 
 ws_router = APIRouter()
 
-# Track connected clients
-clients: set[WebSocket] = set()
+READ_BLOCK_MS = 5000
+READ_BATCH = 500
+
+# ais_stream publishes compact JSON with "type" as the first key, so position
+# messages can be picked out without parsing every payload
+_POSITION_PREFIX = b'{"type":"position"'
+
+# Per-client backlog, in XREAD batches, before a slow client is dropped
+CLIENT_QUEUE_BATCHES = 20
+# A single send taking longer than this means the client has stalled
+SEND_TIMEOUT = 10  # seconds
+
+# Connected clients, each with its own bounded queue drained by its own
+# sender task, so one stalled socket can't hold up the others
+clients: dict[WebSocket, asyncio.Queue[list[str] | None]] = {}
+
+
+async def run_ws_broadcaster() -> None:
+    """Background task: relay live position messages to all WebSocket clients.
+
+    One XREAD loop on the ais:live stream for the whole process; each
+    XREAD result is filtered once and queued as a single batch for every
+    connected socket. Reading by ID means a slow client delays only its
+    own queue; once that queue is full the client is dropped.
+    """
+    logger.info("WebSocket broadcaster starting")
+
+    last_id = "$"
+    while True:
+        try:
+            r = get_redis()
+            while True:
+                resp = await r.xread({LIVE_STREAM: last_id}, count=READ_BATCH, block=READ_BLOCK_MS)
+                if not resp:
+                    continue
+                texts = []
+                for _stream, entries in resp:
+                    for entry_id, fields in entries:
+                        last_id = entry_id
+                        data = fields.get(b"d")
+                        # Only forward position messages to frontend
+                        if data and data.startswith(_POSITION_PREFIX):
+                            # Decode once per message; the frontend expects text frames
+                            texts.append(data.decode())
+                if not texts:
+                    continue
+                for ws, queue in list(clients.items()):
+                    try:
+                        queue.put_nowait(texts)
+                    except asyncio.QueueFull:
+                        logger.warning("WebSocket client too slow, dropping it")
+                        _drop_client(ws)
+        except asyncio.CancelledError:
+            logger.info("WebSocket broadcaster cancelled")
+            return
+        except Exception as e:
+            logger.error(f"WebSocket broadcaster error: {e}, retrying in 5s...")
+            await asyncio.sleep(5)
+
+
+def _drop_client(ws: WebSocket) -> None:
+    """Unregister a client and tell its sender task to stop."""
+    queue = clients.pop(ws, None)
+    if queue is None:
+        return
+    # Make room for the stop marker if the backlog is full
+    if queue.full():
+        queue.get_nowait()
+    queue.put_nowait(None)
+
+
+async def _send_loop(ws: WebSocket, queue: asyncio.Queue[list[str] | None]) -> None:
+    while True:
+        texts = await queue.get()
+        if texts is None:
+            return
+        for text in texts:
+            await asyncio.wait_for(ws.send_text(text), SEND_TIMEOUT)
+
+
+async def _receive_loop(ws: WebSocket) -> None:
+    # Messages are pushed by run_ws_broadcaster; just wait for the close
+    while True:
+        await ws.receive_text()
 
 
 @ws_router.websocket("/ws/vessels")
 async def vessel_ws(websocket: WebSocket):
     await websocket.accept()
-    clients.add(websocket)
+    queue: asyncio.Queue[list[str] | None] = asyncio.Queue(maxsize=CLIENT_QUEUE_BATCHES)
+    clients[websocket] = queue
     logger.info(f"WebSocket client connected ({len(clients)} total)")
 
+    sender = asyncio.create_task(_send_loop(websocket, queue))
+    receiver = asyncio.create_task(_receive_loop(websocket))
     try:
-        r = get_redis()
-        pubsub = r.pubsub()
-        await pubsub.subscribe("ais:live")
-
-        async for message in pubsub.listen():
-            if message["type"] == "message":
-                data = message["data"]
-                try:
-                    parsed = json.loads(data)
-                    # Only forward position messages to frontend
-                    if parsed.get("type") == "position":
-                        await websocket.send_text(data)
-                except (json.JSONDecodeError, TypeError):
-                    pass
-    except WebSocketDisconnect:
-        pass
-    except Exception as e:
-        logger.error(f"WebSocket error: {e}")
+        # Whichever ends first (client closed, a send stalled or failed, or
+        # the broadcaster dropped the client) ends the connection
+        done, _pending = await asyncio.wait({sender, receiver}, return_when=asyncio.FIRST_COMPLETED)
+        for task in done:
+            e = task.exception()
+            if isinstance(e, asyncio.TimeoutError):
+                logger.warning("WebSocket send timed out, dropping client")
+            elif e is not None and not isinstance(e, WebSocketDisconnect):
+                logger.error(f"WebSocket error: {e}")
+        if receiver not in done:
+            try:
+                await asyncio.wait_for(websocket.close(), SEND_TIMEOUT)
+            except Exception:
+                pass
     finally:
-        clients.discard(websocket)
+        sender.cancel()
+        receiver.cancel()
+        clients.pop(websocket, None)
         logger.info(f"WebSocket client disconnected ({len(clients)} total)")
@@ -11,6 +11,13 @@ class Settings(BaseSettings):
     postgres_db: str = "poseidon"
     postgres_host: str = "postgis"
     postgres_port: int = 5432
+    postgres_pool_min_size: int = 2
+    postgres_pool_max_size: int = 20
+    # Per-connection prepared-statement LRU; the bbox/filter queries are
+    # built from f-string clauses, so there are more distinct texts than
+    # asyncpg's default of 100 holds
+    postgres_statement_cache_size: int = 1024
+    postgres_max_inactive_connection_lifetime: float = 300.0  # seconds
 
     # Redis
     redis_host: str = "redis"
@@ -19,6 +26,9 @@ class Settings(BaseSettings):
     # Ingestor
     buffer_flush_interval: float = 2.0
     buffer_batch_size: int = 500
+    # How long the AIS ingestor batches Redis writes; kept well under
+    # buffer_flush_interval since it also delays the live WebSocket feed
+    ais_publish_interval: float = 0.25  # seconds
 
     # Dark vessel detection
     dark_vessel_check_interval: int = 300  # seconds
@@ -57,6 +67,12 @@ class Settings(BaseSettings):
     sar_cfar_pfa: float = 1e-3
     sar_match_radius_m: float = 5000.0
     sar_match_time_window_s: float = 3600.0
+    sar_max_concurrent_processing: int = 4  # scene download+CFAR pipelines
+
+    # Timelapse downloads: when set (e.g. "/internal/timelapse/"), downloads
+    # are handed to a fronting Nginx via X-Accel-Redirect instead of being
+    # streamed from the API process
+    timelapse_accel_redirect_prefix: str = ""
 
     # JWT Authentication
     auth_enabled: bool = False
@@ -75,6 +91,7 @@ class Settings(BaseSettings):
 
     # Scheduled reports
     report_check_interval: int = 300  # seconds
+    report_max_concurrent_generation: int = 2
 
     @property
     def database_url(self) -> str:
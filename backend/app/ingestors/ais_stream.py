@@ -3,6 +3,7 @@ import json
 import logging
 from datetime import datetime, timezone
 
+import orjson
 import websockets
 
 from app.config import settings
@@ -13,6 +14,10 @@ logger = logging.getLogger("poseidon.ais_stream")
 
 AIS_STREAM_URL = "wss://stream.aisstream.io/v0/stream"
 
+# Redis stream feeding the WebSocket broadcaster; only the recent tail is kept
+LIVE_STREAM = "ais:live"
+LIVE_STREAM_MAXLEN = 10_000
+
 SUBSCRIPTION = {
     "APIKey": settings.aisstream_api_key,
     "BoundingBoxes": [[[-90, -180], [90, 180]]],
@@ -101,17 +106,59 @@ async def run_ais_stream():
             await asyncio.sleep(5)
 
 
+async def _publish(r, batch: list[bytes]) -> None:
+    # Dual Redis path: durable buffer + capped live stream for WebSockets
+    pipe = r.pipeline(transaction=False)
+    pipe.rpush("ais:buffer", *batch)
+    for encoded in batch:
+        pipe.xadd(LIVE_STREAM, {"d": encoded}, maxlen=LIVE_STREAM_MAXLEN, approximate=True)
+    await pipe.execute()
+
+
+async def _publish_loop(r, pending: list[bytes], wake: asyncio.Event) -> None:
+    """Flush `pending` to Redis every ais_publish_interval, or sooner when woken."""
+    while True:
+        try:
+            await asyncio.wait_for(wake.wait(), timeout=settings.ais_publish_interval)
+        except asyncio.TimeoutError:
+            pass
+        wake.clear()
+        if pending:
+            batch = pending[:]
+            pending.clear()
+            await _publish(r, batch)
+
+
 async def _connect_and_consume():
     r = get_redis()
+    pending: list[bytes] = []
+    wake = asyncio.Event()
+    publisher = asyncio.create_task(_publish_loop(r, pending, wake), name="ais_publish")
+    try:
+        await _consume(pending, wake, publisher)
+    finally:
+        publisher.cancel()
+        if pending:
+            try:
+                await _publish(r, pending)
+            except Exception as e:
+                logger.error(f"AIS stream: dropped {len(pending)} unpublished messages: {e}")
+
+
+async def _consume(pending: list[bytes], wake: asyncio.Event, publisher: asyncio.Task):
     async with websockets.connect(AIS_STREAM_URL, ping_interval=20) as ws:
         await ws.send(json.dumps(SUBSCRIPTION))
         logger.info("Connected to aisstream.io, subscription sent")
 
         msg_count = 0
         async for raw in ws:
+            if publisher.done():
+                # Surface a Redis failure so run_ais_stream reconnects
+                publisher.result()
+
             try:
-                msg = json.loads(raw)
-            except json.JSONDecodeError:
+                msg = orjson.loads(raw)
+            except orjson.JSONDecodeError:
                 continue
 
             msg_type = msg.get("MessageType")
@@ -126,16 +173,15 @@ async def _connect_and_consume():
             if parsed is None:
                 continue
 
-            # Attach raw message for forensic storage
-            parsed["raw_json"] = msg
-
-            encoded = json.dumps(parsed)
+            # Attach raw message for forensic storage, as the original text so
+            # the flusher can hand it to the jsonb column without re-encoding
+            parsed["raw_json"] = raw if isinstance(raw, str) else raw.decode()
 
-            # Dual Redis path: durable buffer + instant pub/sub
-            pipe = r.pipeline(transaction=False)
-            pipe.rpush("ais:buffer", encoded)
-            pipe.publish("ais:live", encoded)
-            await pipe.execute()
+            # Compact encoding with "type" as the first key; the WebSocket
+            # fan-out relies on this to filter without parsing
+            pending.append(orjson.dumps(parsed))
+            if len(pending) >= settings.buffer_batch_size:
+                wake.set()
 
             msg_count += 1
             if msg_count % 1000 == 0:
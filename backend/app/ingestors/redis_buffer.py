@@ -1,27 +1,42 @@
 import asyncio
-import json
 import logging
 import math
+import re
 from datetime import datetime, timezone
 
 import h3
+import orjson
 
 from app.config import settings
 from app.database import get_db, get_redis
 from app.models.enums import ais_type_to_vessel_type
-from app.services.coastline_service import classify_receiver
+from app.services.coastline_service import classify_receivers
 
 logger = logging.getLogger("poseidon.redis_buffer")
 
 H3_RESOLUTION = 7
 
+# Fractional seconds in a timestamp (the date part has no dots)
+_FRACTION_RE = re.compile(r"\.(\d+)")
+
+_POSITION_STAGE_COLUMNS = [
+    "mmsi", "lon", "lat", "h3_index", "sog", "cog", "heading",
+    "nav_status", "rot", "timestamp", "receiver_class",
+]
+_RAW_MESSAGE_COLUMNS = [
+    "mmsi", "message_type", "raw_json", "flag_impossible_speed", "flag_sart_on_non_sar",
+    "flag_no_identity", "receiver_class", "lat", "lon", "sog", "timestamp",
+]
+
 
 async def run_buffer_flush():
     logger.info("Redis buffer flusher starting...")
     while True:
         try:
-            await asyncio.sleep(settings.buffer_flush_interval)
-            await _flush_batch()
+            # A full batch means a backlog is waiting: keep draining at full
+            # batch size instead of letting the interval cap throughput
+            if await _flush_batch() < settings.buffer_batch_size:
+                await asyncio.sleep(settings.buffer_flush_interval)
         except asyncio.CancelledError:
             logger.info("Buffer flush task cancelled")
             return
@@ -30,35 +45,52 @@ async def run_buffer_flush():
             await asyncio.sleep(1)
 
 
-async def _flush_batch():
+async def _flush_batch() -> int:
+    """Move up to buffer_batch_size buffered messages into Postgres; returns how many were popped."""
     r = get_redis()
     db = get_db()
 
-    # Atomically grab up to batch_size items
-    batch_size = settings.buffer_batch_size
-    pipe = r.pipeline(transaction=True)
-    pipe.lrange("ais:buffer", 0, batch_size - 1)
-    pipe.ltrim("ais:buffer", batch_size, -1)
-    results = await pipe.execute()
-
-    items = results[0]
+    # Atomically grab up to batch_size items (LPOP with count, Redis >= 6.2)
+    items = await r.lpop("ais:buffer", settings.buffer_batch_size)
     if not items:
-        return
+        return 0
 
     positions = []
     statics = []
+    bad_timestamps = 0
 
     for raw in items:
         try:
-            data = json.loads(raw)
-        except (json.JSONDecodeError, TypeError):
+            data = orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            continue
+
+        msg_type = data.get("type")
+        if msg_type != "position" and msg_type != "static":
             continue
 
-        if data.get("type") == "position":
+        # Normalize once here; positions feed both the positions and the
+        # raw-message inserts, which previously each re-derived these
+        ts = _parse_timestamp(data.get("timestamp"))
+        if ts is None:
+            ts = datetime.now(timezone.utc)
+            bad_timestamps += 1
+        data["timestamp"] = ts
+
+        if msg_type == "position":
             positions.append(data)
-        elif data.get("type") == "static":
+        else:
+            data["receiver_class"] = "unknown"  # static reports carry no position
             statics.append(data)
 
+    if bad_timestamps:
+        logger.warning(f"{bad_timestamps} buffered messages had unparseable timestamps; stored with flush time")
+
+    if positions:
+        classes = classify_receivers([p["lon"] for p in positions], [p["lat"] for p in positions])
+        for p, rc in zip(positions, classes):
+            p["receiver_class"] = rc
+
     all_messages = positions + statics
 
     async with db.acquire() as conn:
@@ -75,6 +107,28 @@ async def _flush_batch():
     total = len(positions) + len(statics)
     if positions:
         logger.info(f"Flushed {len(positions)} positions, {len(statics)} statics ({total} total)")
+    return len(items)
+
+
+def _parse_timestamp(ts):
+    """Parse an ingest timestamp; returns None for a string it can't read."""
+    if not isinstance(ts, str):
+        return ts
+    # aisstream sends Go-formatted "2024-03-13 12:00:51.123456789 +0000 UTC".
+    # Go trims trailing zeros from the fraction (".12345", ".1", or none),
+    # while fromisoformat only takes 3 or 6+ digits, so drop the zone name
+    # and pad/truncate the fraction to microseconds
+    if ts.endswith(" UTC"):
+        ts = ts[:-4]
+    ts = _FRACTION_RE.sub(_to_microseconds, ts, count=1)
+    try:
+        return datetime.fromisoformat(ts)
+    except ValueError:
+        return None
+
+
+def _to_microseconds(m: re.Match) -> str:
+    return "." + (m.group(1) + "00000")[:6]
 
 
 async def _upsert_vessels_static(conn, statics: list[dict]):
@@ -116,12 +170,9 @@ async def _upsert_vessels_static(conn, statics: list[dict]):
 
 
 async def _upsert_vessels_from_positions(conn, positions: list[dict]):
-    # Ensure vessel rows exist for position data (dedup by mmsi)
-    seen = {}
-    for p in positions:
-        mmsi = p["mmsi"]
-        if mmsi not in seen:
-            seen[mmsi] = p
+    # Ensure vessel rows exist for position data (dedup by mmsi); walking
+    # backwards lets the first position seen for each vessel win
+    names = {p["mmsi"]: p.get("name") for p in reversed(positions)}
 
     await conn.executemany(
         """
@@ -131,7 +182,7 @@ async def _upsert_vessels_from_positions(conn, positions: list[dict]):
             name = COALESCE(EXCLUDED.name, vessels.name),
             updated_at = NOW()
         """,
-        [(mmsi, p.get("name")) for mmsi, p in seen.items()],
+        list(names.items()),
     )
 
 
@@ -144,15 +195,6 @@ async def _insert_positions(conn, positions: list[dict]):
         except Exception:
             h3_index = None
 
-        ts = p.get("timestamp")
-        if isinstance(ts, str):
-            try:
-                ts = datetime.fromisoformat(ts.replace("Z", "+00:00"))
-            except ValueError:
-                ts = datetime.now(timezone.utc)
-
-        rc = classify_receiver(lon, lat)
-
         rows.append((
             p["mmsi"],
             lon,
@@ -163,18 +205,33 @@ async def _insert_positions(conn, positions: list[dict]):
             p.get("heading"),
             p.get("nav_status"),
             p.get("rot"),
-            ts,
-            rc,
+            p["timestamp"],
+            p["receiver_class"],
         ))
 
-    await conn.executemany(
+    # COPY can't build geometries, so stream plain columns into a
+    # per-connection temp table and convert in one INSERT ... SELECT.
+    # ON COMMIT DELETE ROWS empties it when the flush transaction ends.
+    await conn.execute(
+        """
+        CREATE TEMP TABLE IF NOT EXISTS vessel_positions_stage (
+            mmsi BIGINT, lon DOUBLE PRECISION, lat DOUBLE PRECISION, h3_index TEXT,
+            sog REAL, cog REAL, heading SMALLINT, nav_status TEXT, rot REAL,
+            timestamp TIMESTAMPTZ, receiver_class TEXT
+        ) ON COMMIT DELETE ROWS
+        """
+    )
+    await conn.copy_records_to_table(
+        "vessel_positions_stage", records=rows, columns=_POSITION_STAGE_COLUMNS,
+    )
+    await conn.execute(
         """
         INSERT INTO vessel_positions
             (mmsi, geom, h3_index, sog, cog, heading, nav_status, rot, timestamp, receiver_class)
-        VALUES
-            ($1, ST_SetSRID(ST_MakePoint($2, $3), 4326), $4, $5, $6, $7, $8::nav_status, $9, $10, $11::receiver_class)
-        """,
-        rows,
+        SELECT mmsi, ST_SetSRID(ST_MakePoint(lon, lat), 4326), h3_index, sog, cog, heading,
+               nav_status::nav_status, rot, timestamp, receiver_class::receiver_class
+        FROM vessel_positions_stage
+        """
     )
 
 
@@ -201,66 +258,42 @@ async def _insert_raw_messages(conn, messages: list[dict]):
         lon = m.get("lon")
         sog = m.get("sog")
 
-        ts = m.get("timestamp")
-        if isinstance(ts, str):
-            try:
-                ts = datetime.fromisoformat(ts.replace("Z", "+00:00"))
-            except ValueError:
-                ts = datetime.now(timezone.utc)
-
-        # Forensic flags
-        flag_impossible_speed = False
-        if sog is not None and sog > 50.0 and abs(sog - 102.3) > 0.1:
-            flag_impossible_speed = True
-
-        flag_sart_on_non_sar = False
-        nav = m.get("nav_status")
-        if nav == "ais_sart":
-            flag_sart_on_non_sar = True
-
-        flag_no_identity = False
-        if msg_type == "position" and not m.get("name"):
-            flag_no_identity = True
-
-        rc = classify_receiver(lon, lat) if lat is not None and lon is not None else "unknown"
-
         rows.append((
             mmsi,
             msg_type,
-            json.dumps(raw_json),
-            flag_impossible_speed,
-            flag_sart_on_non_sar,
-            flag_no_identity,
-            rc,
+            raw_json,
+            # Forensic flags: impossible speed (102.3 is "not available"),
+            # AIS-SART status, and positions from unidentified vessels
+            sog is not None and sog > 50.0 and abs(sog - 102.3) > 0.1,
+            m.get("nav_status") == "ais_sart",
+            msg_type == "position" and not m.get("name"),
+            m["receiver_class"],
             lat,
             lon,
             sog,
-            ts,
+            m["timestamp"],
         ))
 
     if not rows:
         return
 
-    await conn.executemany(
-        """
-        INSERT INTO ais_raw_messages
-            (mmsi, message_type, raw_json, flag_impossible_speed, flag_sart_on_non_sar,
-             flag_no_identity, receiver_class, lat, lon, sog, timestamp)
-        VALUES
-            ($1, $2, $3::jsonb, $4, $5, $6, $7::receiver_class, $8, $9, $10, $11)
-        """,
-        rows,
+    await conn.copy_records_to_table(
+        "ais_raw_messages", records=rows, columns=_RAW_MESSAGE_COLUMNS,
     )
 
 
 async def _detect_identity_changes(conn, statics: list[dict]):
     """Compare incoming static data against current vessel record and log changes."""
+    current_rows = await conn.fetch(
+        "SELECT mmsi, name, ship_type, callsign, imo, destination FROM vessels WHERE mmsi = ANY($1::bigint[])",
+        list({s["mmsi"] for s in statics}),
+    )
+    current_by_mmsi = {r["mmsi"]: r for r in current_rows}
+
+    history = []
     for s in statics:
         mmsi = s["mmsi"]
-        current = await conn.fetchrow(
-            "SELECT name, ship_type, callsign, imo, destination FROM vessels WHERE mmsi = $1",
-            mmsi,
-        )
+        current = current_by_mmsi.get(mmsi)
         if current is None:
             continue
 
@@ -283,15 +316,20 @@ async def _detect_identity_changes(conn, statics: list[dict]):
             changed = True
 
         if changed:
-            await conn.execute(
-                """
-                INSERT INTO vessel_identity_history (mmsi, name, ship_type, callsign, imo, destination)
-                VALUES ($1, $2, $3::vessel_type, $4, $5, $6)
-                """,
+            history.append((
                 mmsi,
                 incoming_name or current["name"],
                 incoming_type,
                 incoming_callsign or current["callsign"],
                 incoming_imo or current["imo"],
                 incoming_dest or current["destination"],
-            )
+            ))
+
+    if history:
+        await conn.executemany(
+            """
+            INSERT INTO vessel_identity_history (mmsi, name, ship_type, callsign, imo, destination)
+            VALUES ($1, $2, $3::vessel_type, $4, $5, $6)
+            """,
+            history,
+        )
@@ -4,6 +4,7 @@ from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
 from app.database import init_db, close_db, init_redis, close_redis
 from app.ingestors.ais_stream import run_ais_stream
@@ -20,9 +21,11 @@ from app.services.coastline_service import init_coastline_buffer
 from app.services.eez_service import init_eez_zones
 from app.services.webcam_service import seed_webcams
 from app.services.cmems_service import fetch_currents
+from app.api.response_cache import run_cache_invalidation_listener
 from app.api.router import api_router
-from app.api.ws import ws_router
-from app.middleware.audit_middleware import AuditMiddleware
+from app.api.ws import ws_router, run_ws_broadcaster
+from app.middleware.audit_middleware import AuditMiddleware, run_audit_writer
+from app.middleware.gzip_middleware import JSONGZipMiddleware
 
 logging.basicConfig(
     level=logging.INFO,
@@ -70,6 +73,9 @@ async def lifespan(app: FastAPI):
         asyncio.create_task(run_eez_monitor(), name="eez_monitor"),
         asyncio.create_task(run_acoustic_fetcher(), name="acoustic_fetcher"),
         asyncio.create_task(run_report_scheduler(), name="report_scheduler"),
+        asyncio.create_task(run_cache_invalidation_listener(), name="cache_invalidation"),
+        asyncio.create_task(run_ws_broadcaster(), name="ws_broadcaster"),
+        asyncio.create_task(run_audit_writer(), name="audit_writer"),
     ]
 
     yield
@@ -88,11 +94,16 @@ app = FastAPI(
     title="Poseidon Maritime Intelligence",
     version="0.2.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Audit middleware (chain of custody logging)
 app.add_middleware(AuditMiddleware)
 
+# Compress JSON/GeoJSON payloads (heatmaps, EEZ zones, ports) on the wire;
+# PDF/MP4 file responses pass through uncompressed
+app.add_middleware(JSONGZipMiddleware, minimum_size=1024, compresslevel=5)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
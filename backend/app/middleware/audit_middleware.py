@@ -1,9 +1,12 @@
 """Chain of custody audit logging middleware.
 
 Logs every API request with user context, method, path, status,
-client IP, and response time to the audit_log table.
+client IP, and response time to the audit_log table. Rows are queued by
+the middleware and written in batches by run_audit_writer, so the
+database round-trip stays off the response path.
 """
 
+import asyncio
 import time
 import logging
 
@@ -16,6 +19,89 @@ from app.services.auth_service import decode_token
 
 logger = logging.getLogger("poseidon.audit")
 
+AUDIT_BATCH_SIZE = 500
+AUDIT_FLUSH_INTERVAL = 0.5  # seconds
+AUDIT_QUEUE_MAX = 10_000  # rows beyond this are dropped while the DB is behind
+
+_AUDIT_COLUMNS = [
+    "user_id", "username", "method", "path", "status_code",
+    "client_ip", "user_agent", "response_time_ms",
+]
+
+_queue: asyncio.Queue[tuple] = asyncio.Queue(maxsize=AUDIT_QUEUE_MAX)
+
+
+_AUDIT_INSERT = """
+    INSERT INTO audit_log (user_id, username, method, path, status_code,
+                           client_ip, user_agent, response_time_ms)
+    SELECT u.id, a.username, a.method, a.path, a.status_code,
+           a.client_ip, a.user_agent, a.response_time_ms
+    FROM unnest($1::int[], $2::text[], $3::text[], $4::text[], $5::int[],
+                $6::text[], $7::text[], $8::float8[])
+        AS a(user_id, username, method, path, status_code,
+             client_ip, user_agent, response_time_ms)
+    LEFT JOIN users u ON u.id = a.user_id
+"""
+
+
+async def _write_batch(batch: list[tuple]) -> None:
+    try:
+        db = get_db()
+        async with db.acquire() as conn:
+            try:
+                await conn.copy_records_to_table("audit_log", records=batch, columns=_AUDIT_COLUMNS)
+                return
+            except Exception as e:
+                logger.warning("Audit COPY of %d rows failed, retrying as INSERT: %s", len(batch), e)
+
+            # A token can outlive its user (audit_log.user_id references
+            # users); keep those rows with a NULL user_id instead of losing
+            # the batch
+            try:
+                await conn.execute(_AUDIT_INSERT, *(list(col) for col in zip(*batch)))
+                return
+            except Exception as e:
+                logger.warning("Audit batch INSERT failed, writing rows one by one: %s", e)
+
+            for row in batch:
+                try:
+                    await conn.execute(_AUDIT_INSERT, *([v] for v in row))
+                except Exception as e:
+                    logger.error("Audit log row dropped (%s %s): %s", row[2], row[3], e)
+    except Exception as e:
+        logger.error("Audit log write failed, dropped %d rows: %s", len(batch), e)
+
+
+async def run_audit_writer() -> None:
+    """Background task: drain queued audit rows into audit_log.
+
+    Waits for a first row, then collects more until AUDIT_BATCH_SIZE rows
+    or AUDIT_FLUSH_INTERVAL has passed, and COPYs the batch.
+    """
+    logger.info("Audit writer starting")
+    loop = asyncio.get_running_loop()
+    batch: list[tuple] = []
+    try:
+        while True:
+            batch.append(await _queue.get())
+            deadline = loop.time() + AUDIT_FLUSH_INTERVAL
+            while len(batch) < AUDIT_BATCH_SIZE:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(_queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            await _write_batch(batch)
+            batch = []
+    except asyncio.CancelledError:
+        while not _queue.empty():
+            batch.append(_queue.get_nowait())
+        if batch:
+            await _write_batch(batch)
+        logger.info("Audit writer cancelled")
+
 
 class AuditMiddleware(BaseHTTPMiddleware):
     """Starlette middleware that logs every request to the audit_log table."""
@@ -30,6 +116,8 @@ class AuditMiddleware(BaseHTTPMiddleware):
         if auth_header.startswith("Bearer "):
             token = auth_header.split(" ", 1)[1]
             payload = decode_token(token)
+            # Reused by get_current_user so the token is verified once per request
+            request.state.jwt_payload = payload
             if payload:
                 user_id = int(payload.get("sub", 0)) or None
                 username = payload.get("username")
@@ -43,16 +131,9 @@ class AuditMiddleware(BaseHTTPMiddleware):
         if path in ("/health", "/ws/vessels") or path.startswith("/docs") or path.startswith("/openapi"):
             return response
 
-        # Async write to DB — fire and forget
+        # Fire and forget: run_audit_writer batches these into audit_log
         try:
-            db = get_db()
-            await db.execute(
-                """
-                INSERT INTO audit_log
-                    (user_id, username, method, path, status_code,
-                     client_ip, user_agent, response_time_ms)
-                VALUES ($1, $2, $3, $4, $5, $6, $7, $8)
-                """,
+            _queue.put_nowait((
                 user_id,
                 username,
                 request.method,
@@ -61,9 +142,9 @@ class AuditMiddleware(BaseHTTPMiddleware):
                 request.client.host if request.client else None,
                 request.headers.get("user-agent", "")[:500],
                 round(elapsed_ms, 2),
-            )
-        except Exception as e:
+            ))
+        except asyncio.QueueFull:
             # Never let audit logging break the request
-            logger.debug("Audit log write failed: %s", e)
+            logger.debug("Audit queue full, dropping entry for %s", path)
 
         return response
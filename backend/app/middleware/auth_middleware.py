@@ -30,8 +30,10 @@ async def get_current_user(request: Request) -> dict:
     if not auth_header or not auth_header.startswith("Bearer "):
         raise HTTPException(status_code=401, detail="Missing authentication token")
 
-    token = auth_header.split(" ", 1)[1]
-    payload = decode_token(token)
+    # AuditMiddleware has normally decoded this request's token already
+    payload = getattr(request.state, "jwt_payload", None)
+    if payload is None:
+        payload = decode_token(auth_header.split(" ", 1)[1])
     if not payload:
         raise HTTPException(status_code=401, detail="Invalid or expired token")
 
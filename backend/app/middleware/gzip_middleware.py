@@ -0,0 +1,38 @@
+"""Gzip compression restricted to JSON responses.
+
+Starlette's GZipMiddleware compresses any body over minimum_size, which
+would also gzip the PDF and MP4 FileResponses: already-compressed data,
+zlib work on the event loop, no Content-Length, and gzipped 206 ranges
+that break seeking. This variant only compresses JSON/GeoJSON and passes
+every other response through untouched.
+"""
+
+from starlette.datastructures import Headers
+from starlette.middleware.gzip import GZipMiddleware, GZipResponder
+from starlette.types import Message, Receive, Scope, Send
+
+COMPRESSIBLE_MEDIA_TYPES = frozenset({"application/json", "application/geo+json"})
+
+
+class _JSONGZipResponder(GZipResponder):
+    passthrough = False
+
+    async def send_with_gzip(self, message: Message) -> None:
+        if message["type"] == "http.response.start":
+            content_type = Headers(raw=message["headers"]).get("content-type", "")
+            media_type = content_type.split(";", 1)[0].strip().lower()
+            if media_type not in COMPRESSIBLE_MEDIA_TYPES:
+                self.passthrough = True
+        if self.passthrough:
+            await self.send(message)
+            return
+        await super().send_with_gzip(message)
+
+
+class JSONGZipMiddleware(GZipMiddleware):
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and "gzip" in Headers(scope=scope).get("Accept-Encoding", ""):
+            responder = _JSONGZipResponder(self.app, self.minimum_size, compresslevel=self.compresslevel)
+            await responder(scope, receive, send)
+            return
+        await self.app(scope, receive, send)
@@ -38,10 +38,7 @@ class AlertStatus(str, Enum):
     RESOLVED = "resolved"
 
 
-# AIS type code to VesselType mapping
-def ais_type_to_vessel_type(code: int | None) -> VesselType:
-    if code is None:
-        return VesselType.UNKNOWN
+def _classify_ais_type(code: int) -> VesselType:
     if 70 <= code <= 79:
         return VesselType.CARGO
     if 80 <= code <= 89:
@@ -63,6 +60,17 @@ def ais_type_to_vessel_type(code: int | None) -> VesselType:
     return VesselType.UNKNOWN
 
 
+# Ship type is an 8-bit field, so every possible code is precomputed
+_AIS_TYPE_LUT: tuple[VesselType, ...] = tuple(_classify_ais_type(code) for code in range(256))
+
+
+# AIS type code to VesselType mapping
+def ais_type_to_vessel_type(code: int | None) -> VesselType:
+    if code is None or not 0 <= code < 256:
+        return VesselType.UNKNOWN
+    return _AIS_TYPE_LUT[code]
+
+
 # AIS navigational status code to NavStatus mapping
 NAV_STATUS_MAP: dict[int, NavStatus] = {
     0: NavStatus.UNDER_WAY_USING_ENGINE,
@@ -6,6 +6,7 @@ to fetching real data.
 """
 
 import asyncio
+import itertools
 import math
 import random
 import logging
@@ -30,6 +31,9 @@ HYDROPHONE_ARRAYS = [
 ]
 
 EVENT_TYPES = ["ship_noise", "seismic", "biological", "unknown", "explosion"]
+EVENT_TYPE_CUM_WEIGHTS = list(itertools.accumulate([50, 15, 20, 10, 5]))
+
+_ACOUSTIC_STAGE_COLUMNS = ["source", "event_type", "lon", "lat", "bearing", "magnitude", "event_time"]
 
 
 async def run_acoustic_fetcher() -> None:
@@ -57,19 +61,14 @@ async def _fetch_or_generate() -> int:
     Each cycle generates 0-3 events per array with realistic properties.
     """
     db = get_db()
-    count = 0
+    rows = []
     now = datetime.now(timezone.utc)
 
     for array in HYDROPHONE_ARRAYS:
         # Each array has 0-3 events per cycle
         num_events = random.randint(0, 3)
-        for _ in range(num_events):
-            event_type = random.choices(
-                EVENT_TYPES,
-                weights=[50, 15, 20, 10, 5],
-                k=1,
-            )[0]
-
+        event_types = random.choices(EVENT_TYPES, cum_weights=EVENT_TYPE_CUM_WEIGHTS, k=num_events)
+        for event_type in event_types:
             # Random offset from array position (within ~200km)
             offset_lon = random.uniform(-2.0, 2.0)
             offset_lat = random.uniform(-2.0, 2.0)
@@ -94,19 +93,39 @@ async def _fetch_or_generate() -> int:
             # Event time is slightly in the past (within last interval)
             event_time = now - timedelta(seconds=random.randint(0, FETCH_INTERVAL))
 
-            try:
-                await db.execute(
-                    """
-                    INSERT INTO acoustic_events
-                        (source, event_type, geom, bearing, magnitude, event_time)
-                    VALUES ($1, $2, ST_SetSRID(ST_MakePoint($3, $4), 4326), $5, $6, $7)
-                    """,
-                    array["name"],
-                    event_type,
-                    lon, lat, bearing, magnitude, event_time,
-                )
-                count += 1
-            except Exception as e:
-                logger.debug("Failed to insert acoustic event: %s", e)
-
-    return count
+            rows.append((array["name"], event_type, lon, lat, bearing, magnitude, event_time))
+
+    if not rows:
+        return 0
+
+    async with db.acquire() as conn:
+        async with conn.transaction():
+            await _bulk_insert_acoustic(conn, rows)
+    return len(rows)
+
+
+async def _bulk_insert_acoustic(conn, rows: list[tuple]) -> None:
+    """Stream (source, event_type, lon, lat, bearing, magnitude, event_time) rows into acoustic_events."""
+    # Same shape as the AIS position flush: COPY plain columns into a
+    # per-connection temp table, build the geometries in one INSERT ... SELECT,
+    # and let ON COMMIT DELETE ROWS clear the stage
+    await conn.execute(
+        """
+        CREATE TEMP TABLE IF NOT EXISTS acoustic_events_stage (
+            source TEXT, event_type TEXT, lon DOUBLE PRECISION, lat DOUBLE PRECISION,
+            bearing REAL, magnitude REAL, event_time TIMESTAMPTZ
+        ) ON COMMIT DELETE ROWS
+        """
+    )
+    await conn.copy_records_to_table(
+        "acoustic_events_stage", records=rows, columns=_ACOUSTIC_STAGE_COLUMNS,
+    )
+    await conn.execute(
+        """
+        INSERT INTO acoustic_events
+            (source, event_type, geom, bearing, magnitude, event_time)
+        SELECT source, event_type, ST_SetSRID(ST_MakePoint(lon, lat), 4326),
+               bearing, magnitude, event_time
+        FROM acoustic_events_stage
+        """
+    )
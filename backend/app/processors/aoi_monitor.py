@@ -30,80 +30,53 @@ async def _check_aoi_crossings():
     For each active AOI:
     - Find vessels now inside that weren't before -> entry event
     - Find vessels that were inside but aren't now -> exit event
+
+    The diff runs server-side as one statement: presence rows are
+    inserted/deleted and the matching events written from their
+    RETURNING sets, so no MMSI lists travel to the client.
     """
     db = get_db()
-    async with db.acquire() as conn:
-        # Get all active AOIs
-        aois = await conn.fetch(
-            "SELECT id, name FROM areas_of_interest WHERE active = TRUE"
+    row = await db.fetchrow(
+        """
+        WITH inside AS (
+            SELECT aoi.id AS aoi_id, lvp.mmsi, ST_X(lvp.geom) AS lon, ST_Y(lvp.geom) AS lat,
+                   lvp.sog, v.name AS vessel_name, v.ship_type::text AS ship_type
+            FROM areas_of_interest aoi
+            JOIN latest_vessel_positions lvp ON ST_Covers(aoi.geom, lvp.geom)
+            JOIN vessels v ON v.mmsi = lvp.mmsi
+            WHERE aoi.active = TRUE
+        ),
+        entered AS (
+            INSERT INTO aoi_vessel_presence (aoi_id, mmsi)
+            SELECT aoi_id, mmsi FROM inside
+            ON CONFLICT DO NOTHING
+            RETURNING aoi_id, mmsi
+        ),
+        exited AS (
+            DELETE FROM aoi_vessel_presence p
+            USING areas_of_interest aoi
+            WHERE aoi.id = p.aoi_id
+              AND aoi.active = TRUE
+              AND NOT EXISTS (
+                  SELECT 1 FROM inside i WHERE i.aoi_id = p.aoi_id AND i.mmsi = p.mmsi
+              )
+            RETURNING p.aoi_id, p.mmsi
+        ),
+        events AS (
+            INSERT INTO aoi_events (aoi_id, mmsi, event_type, vessel_name, ship_type, lon, lat, sog)
+            SELECT i.aoi_id, i.mmsi, 'entry', i.vessel_name, i.ship_type, i.lon, i.lat, i.sog
+            FROM entered e
+            JOIN inside i ON i.aoi_id = e.aoi_id AND i.mmsi = e.mmsi
+            UNION ALL
+            SELECT aoi_id, mmsi, 'exit', NULL, NULL, NULL, NULL, NULL
+            FROM exited
+            RETURNING event_type
         )
-
-        if not aois:
-            return
-
-        total_entries = 0
-        total_exits = 0
-
-        for aoi in aois:
-            aoi_id = aoi["id"]
-
-            # Find vessels currently inside this AOI
-            inside_now = await conn.fetch(
-                """
-                SELECT lvp.mmsi, ST_X(lvp.geom) AS lon, ST_Y(lvp.geom) AS lat,
-                       lvp.sog, v.name AS vessel_name, v.ship_type
-                FROM latest_vessel_positions lvp
-                JOIN vessels v ON v.mmsi = lvp.mmsi
-                JOIN areas_of_interest aoi ON aoi.id = $1
-                WHERE ST_Contains(aoi.geom, lvp.geom)
-                """,
-                aoi_id,
-            )
-            inside_mmsis = {r["mmsi"] for r in inside_now}
-
-            # Get previously tracked presence
-            prev_presence = await conn.fetch(
-                "SELECT mmsi FROM aoi_vessel_presence WHERE aoi_id = $1",
-                aoi_id,
-            )
-            prev_mmsis = {r["mmsi"] for r in prev_presence}
-
-            # New entries
-            entered = inside_mmsis - prev_mmsis
-            for r in inside_now:
-                if r["mmsi"] in entered:
-                    await conn.execute(
-                        """
-                        INSERT INTO aoi_vessel_presence (aoi_id, mmsi)
-                        VALUES ($1, $2) ON CONFLICT DO NOTHING
-                        """,
-                        aoi_id, r["mmsi"],
-                    )
-                    await conn.execute(
-                        """
-                        INSERT INTO aoi_events (aoi_id, mmsi, event_type, vessel_name, ship_type, lon, lat, sog)
-                        VALUES ($1, $2, 'entry', $3, $4, $5, $6, $7)
-                        """,
-                        aoi_id, r["mmsi"], r["vessel_name"], r["ship_type"],
-                        r["lon"], r["lat"], r["sog"],
-                    )
-                    total_entries += 1
-
-            # Exits
-            exited = prev_mmsis - inside_mmsis
-            for mmsi in exited:
-                await conn.execute(
-                    "DELETE FROM aoi_vessel_presence WHERE aoi_id = $1 AND mmsi = $2",
-                    aoi_id, mmsi,
-                )
-                await conn.execute(
-                    """
-                    INSERT INTO aoi_events (aoi_id, mmsi, event_type)
-                    VALUES ($1, $2, 'exit')
-                    """,
-                    aoi_id, mmsi,
-                )
-                total_exits += 1
-
-        if total_entries > 0 or total_exits > 0:
-            logger.info("AOI monitor: %d entries, %d exits", total_entries, total_exits)
+        SELECT COUNT(*) FILTER (WHERE event_type = 'entry') AS entries,
+               COUNT(*) FILTER (WHERE event_type = 'exit') AS exits
+        FROM events
+        """
+    )
+
+    if row["entries"] or row["exits"]:
+        logger.info("AOI monitor: %d entries, %d exits", row["entries"], row["exits"])
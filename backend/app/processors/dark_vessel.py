@@ -3,6 +3,8 @@ import math
 import logging
 from datetime import datetime, timezone
 
+import numpy as np
+
 from app.config import settings
 from app.database import get_db
 
@@ -34,6 +36,23 @@ def dead_reckon(lat: float, lon: float, sog: float, cog: float, hours: float) ->
     return new_lat, new_lon
 
 
+def dead_reckon_batch(lats, lons, sogs, cogs, hours) -> tuple[np.ndarray, np.ndarray]:
+    """Vectorized dead_reckon over parallel arrays; stationary entries keep their position."""
+    lats = np.asarray(lats, dtype=np.float64)
+    lons = np.asarray(lons, dtype=np.float64)
+    sogs = np.asarray(sogs, dtype=np.float64)
+    cog_rad = np.radians(np.asarray(cogs, dtype=np.float64))
+
+    distance_deg = sogs * np.asarray(hours, dtype=np.float64) / 60
+    new_lat = lats + distance_deg * np.cos(cog_rad)
+    new_lon = lons + distance_deg * np.sin(cog_rad) / np.cos(np.radians(lats))
+
+    moving = sogs > 0
+    new_lat = np.where(moving, np.clip(new_lat, -90, 90), lats)
+    new_lon = np.where(moving, ((new_lon + 180) % 360) - 180, lons)
+    return new_lat, new_lon
+
+
 async def run_dark_vessel_detector():
     logger.info("Dark vessel detector starting...")
     while True:
@@ -55,7 +74,8 @@ async def _detect_dark_vessels():
     active_window = settings.dark_vessel_active_window_hours
 
     async with db.acquire() as conn:
-        # Find vessels that went dark: last position > gap_hours ago but active within active_window
+        # Find vessels that went dark: last position > gap_hours ago but active within active_window,
+        # skipping those that already have an active alert
         dark_vessels = await conn.fetch(
             """
             SELECT lv.mmsi, ST_X(lv.geom) as lon, ST_Y(lv.geom) as lat,
@@ -65,36 +85,38 @@ async def _detect_dark_vessels():
             WHERE lv.timestamp < NOW() - make_interval(hours => $1)
               AND lv.timestamp > NOW() - make_interval(hours => $2)
               AND lv.sog > 0.5
+              AND NOT EXISTS (
+                  SELECT 1 FROM dark_vessel_alerts a
+                  WHERE a.mmsi = lv.mmsi AND a.status = 'active'
+              )
             """,
             gap_hours,
             active_window,
         )
 
-        if not dark_vessels:
-            return
+        hours_since = [float(v["hours_since"]) for v in dark_vessels]
+        sogs = [float(v["sog"] or 0) for v in dark_vessels]
+        cogs = [float(v["cog"] or 0) for v in dark_vessels]
+        pred_lats, pred_lons = dead_reckon_batch(
+            [v["lat"] for v in dark_vessels], [v["lon"] for v in dark_vessels],
+            sogs, cogs, hours_since,
+        )
 
-        new_alerts = 0
-        for v in dark_vessels:
-            # Check if already has active alert
-            existing = await conn.fetchval(
-                """
-                SELECT id FROM dark_vessel_alerts
-                WHERE mmsi = $1 AND status = 'active'
-                """,
+        alerts = []
+        for i, v in enumerate(dark_vessels):
+            sog = sogs[i]
+            alerts.append((
                 v["mmsi"],
-            )
-            if existing:
-                continue
-
-            hours_since = float(v["hours_since"])
-            sog = float(v["sog"] or 0)
-            cog = float(v["cog"] or 0)
-            pred_lat, pred_lon = dead_reckon(
-                v["lat"], v["lon"], sog, cog, hours_since
-            )
-            search_radius = (sog or 1) * hours_since * 0.5
+                float(v["lon"]), float(v["lat"]),
+                float(pred_lons[i]), float(pred_lats[i]),
+                sog, cogs[i],
+                hours_since[i],
+                (sog or 1) * hours_since[i] * 0.5,  # search radius
+                v["timestamp"],
+            ))
 
-            await conn.execute(
+        if alerts:
+            await conn.executemany(
                 """
                 INSERT INTO dark_vessel_alerts
                     (mmsi, last_known_geom, predicted_geom, last_sog, last_cog,
@@ -103,15 +125,9 @@ async def _detect_dark_vessels():
                         ST_SetSRID(ST_MakePoint($4, $5), 4326),
                         $6, $7, $8, $9, $10)
                 """,
-                v["mmsi"],
-                float(v["lon"]), float(v["lat"]),
-                pred_lon, pred_lat,
-                sog, cog,
-                hours_since,
-                search_radius,
-                v["timestamp"],
+                alerts,
             )
-            new_alerts += 1
+        new_alerts = len(alerts)
 
         # Auto-resolve alerts for vessels that reappeared
         resolved = await conn.execute(
@@ -1,22 +1,21 @@
 """EEZ boundary crossing monitor.
 
 Background task that checks vessel positions against EEZ boundaries
-and records entry/exit events.
+and records entry/exit events. The last known EEZ per vessel lives in
+vessel_eez_state, so restarts don't replay entries and several
+workers can share it.
 """
 
 import asyncio
 import logging
-from datetime import datetime, timezone
 
 from app.database import get_db
-from app.services.eez_service import find_eez_for_point, record_eez_event
+from app.services.eez_service import apply_eez_states, find_eezs_for_points
 
 logger = logging.getLogger("poseidon.eez_monitor")
 
-# Track last known EEZ per vessel: mmsi -> eez_id | None
-_vessel_eez_state: dict[int, int | None] = {}
-
 CHECK_INTERVAL = 120  # seconds
+BATCH_SIZE = 2048  # positions resolved and diffed per round-trip
 
 
 async def run_eez_monitor() -> None:
@@ -41,47 +40,48 @@ async def run_eez_monitor() -> None:
 async def _check_eez_crossings() -> None:
     """Check all active vessels for EEZ boundary crossings."""
     db = get_db()
-
-    rows = await db.fetch(
-        """
-        SELECT mmsi, ST_X(geom) AS lon, ST_Y(geom) AS lat, timestamp
-        FROM latest_vessel_positions
-        WHERE timestamp > NOW() - INTERVAL '30 minutes'
-        """
+    entries = exits = 0
+
+    # Stream the recent positions in batches instead of materializing the
+    # whole set; each batch is resolved and diffed on the same connection
+    # while the cursor's transaction is open
+    async with db.acquire() as conn:
+        async with conn.transaction():
+            batch = []
+            async for r in conn.cursor(
+                """
+                SELECT mmsi, ST_X(geom) AS lon, ST_Y(geom) AS lat, timestamp
+                FROM latest_vessel_positions
+                WHERE timestamp > NOW() - INTERVAL '30 minutes'
+                """,
+                prefetch=BATCH_SIZE,
+            ):
+                batch.append(r)
+                if len(batch) >= BATCH_SIZE:
+                    n_in, n_out = await _apply_batch(conn, batch)
+                    entries += n_in
+                    exits += n_out
+                    batch = []
+            if batch:
+                n_in, n_out = await _apply_batch(conn, batch)
+                entries += n_in
+                exits += n_out
+
+    if entries or exits:
+        logger.info("EEZ monitor: %d crossing events recorded", entries + exits)
+
+
+async def _apply_batch(conn, rows) -> tuple[int, int]:
+    lons = [float(r["lon"]) for r in rows]
+    lats = [float(r["lat"]) for r in rows]
+    zones = find_eezs_for_points(lons, lats)
+
+    return await apply_eez_states(
+        conn,
+        [r["mmsi"] for r in rows],
+        [z["id"] if z else None for z in zones],
+        [z["name"] if z else None for z in zones],
+        lons,
+        lats,
+        [r["timestamp"] for r in rows],
     )
-
-    events_created = 0
-
-    for r in rows:
-        mmsi = r["mmsi"]
-        lon = float(r["lon"])
-        lat = float(r["lat"])
-        ts = r["timestamp"]
-
-        current_eez = find_eez_for_point(lon, lat)
-        current_eez_id = current_eez["id"] if current_eez else None
-
-        prev_eez_id = _vessel_eez_state.get(mmsi)
-
-        if current_eez_id != prev_eez_id:
-            # State changed — record events
-            if prev_eez_id is not None:
-                # Exit from previous EEZ
-                # We don't have the previous EEZ name cached, so just record the ID
-                await record_eez_event(
-                    mmsi, prev_eez_id, "", "exit", lon, lat, ts,
-                )
-                events_created += 1
-
-            if current_eez_id is not None:
-                # Entry into new EEZ
-                await record_eez_event(
-                    mmsi, current_eez_id, current_eez["name"],
-                    "entry", lon, lat, ts,
-                )
-                events_created += 1
-
-            _vessel_eez_state[mmsi] = current_eez_id
-
-    if events_created > 0:
-        logger.info("EEZ monitor: %d crossing events recorded", events_created)
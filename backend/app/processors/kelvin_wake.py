@@ -18,6 +18,10 @@ logger = logging.getLogger("poseidon.kelvin_wake")
 # Kelvin wake half-angle (theoretical: 19.47 degrees)
 KELVIN_HALF_ANGLE = 19.47
 
+# Multipliers for the position hash in _analyze_wake_signature
+_MIX_LON = 0x9E3779B97F4A7C15
+_MIX_LAT = 0xBF58476D1CE4E5B9
+
 
 async def extract_kelvin_wakes(scene_id: int) -> int:
     """Extract Kelvin wake patterns from a processed SAR scene.
@@ -58,40 +62,45 @@ async def extract_kelvin_wakes(scene_id: int) -> int:
         logger.info("Scene %d: no detections to analyze for wakes", scene_id)
         return 0
 
-    count = 0
+    wakes = []
 
     for det in detections:
         try:
             # In production, extract a chip from the SAR GeoTIFF around the detection
             # and apply Radon transform + FFT to find wake lines.
             # For now, use a simplified analysis.
-
+            lon, lat = float(det["lon"]), float(det["lat"])
             wake_result = _analyze_wake_signature(
-                lon=float(det["lon"]),
-                lat=float(det["lat"]),
+                lon=lon,
+                lat=lat,
                 intensity_db=float(det["rcs_db"]) if det["rcs_db"] else None,
             )
-
-            if wake_result:
-                await db.execute(
-                    """
-                    INSERT INTO kelvin_wake_detections
-                        (scene_id, geom, wake_angle_deg, estimated_speed_knots,
-                         confidence, matched_mmsi)
-                    VALUES ($1, ST_SetSRID(ST_MakePoint($2, $3), 4326),
-                            $4, $5, $6, $7)
-                    """,
-                    scene_id,
-                    float(det["lon"]), float(det["lat"]),
-                    wake_result["angle"],
-                    wake_result["speed"],
-                    wake_result["confidence"],
-                    det["matched_mmsi"],
-                )
-                count += 1
-
         except Exception as e:
             logger.debug("Wake analysis failed for detection %d: %s", det["id"], e)
+            continue
+
+        if wake_result:
+            wakes.append((
+                scene_id,
+                lon, lat,
+                wake_result["angle"],
+                wake_result["speed"],
+                wake_result["confidence"],
+                det["matched_mmsi"],
+            ))
+
+    if wakes:
+        await db.executemany(
+            """
+            INSERT INTO kelvin_wake_detections
+                (scene_id, geom, wake_angle_deg, estimated_speed_knots,
+                 confidence, matched_mmsi)
+            VALUES ($1, ST_SetSRID(ST_MakePoint($2, $3), 4326),
+                    $4, $5, $6, $7)
+            """,
+            wakes,
+        )
+    count = len(wakes)
 
     logger.info("Scene %d: %d Kelvin wakes detected", scene_id, count)
     return count
@@ -122,8 +131,11 @@ def _analyze_wake_signature(
     else:
         detection_probability = 0.7
 
-    # Use deterministic pseudo-random based on position
-    hash_val = abs(hash((round(lon, 3), round(lat, 3)))) % 100
+    # Deterministic pseudo-random value from the position rounded to 1e-3
+    # degrees: a 64-bit multiplicative mix of the two integer coordinates,
+    # with no tuple to build or hash
+    h = (round(lon * 1000) * _MIX_LON) ^ (round(lat * 1000) * _MIX_LAT)
+    hash_val = (h & 0xFFFFFFFFFFFFFFFF) % 100
     if hash_val > detection_probability * 100:
         return None
 
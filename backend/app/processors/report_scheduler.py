@@ -7,7 +7,6 @@ Uses a simple hour-based check rather than full cron parsing.
 
 import asyncio
 import logging
-from datetime import datetime, timezone, timedelta
 
 from app.database import get_db
 from app.services.scheduled_report_service import generate_digest
@@ -37,31 +36,24 @@ async def run_report_scheduler() -> None:
 async def _check_and_run_reports() -> None:
     """Check for reports that need to be run."""
     db = get_db()
-    now = datetime.now(timezone.utc)
 
-    # Find enabled reports that haven't run in the last 23 hours
-    # (simplified cron: just check if enough time has passed)
+    # Find enabled reports scheduled for the current UTC hour that haven't
+    # run in the last 23 hours (simplified cron: only the hour field is
+    # honoured, parsed into the generated schedule_hour column). Nearly
+    # every check returns no rows.
     rows = await db.fetch(
         """
-        SELECT id, name, schedule_cron, config
+        SELECT id, name
         FROM scheduled_reports
         WHERE enabled = TRUE
+          AND schedule_hour = EXTRACT(HOUR FROM NOW() AT TIME ZONE 'UTC')::int
           AND (last_run_at IS NULL OR last_run_at < NOW() - INTERVAL '23 hours')
         """
     )
+    if not rows:
+        return
 
     for report in rows:
-        # Parse simple cron hour (e.g., "0 6 * * *" -> hour 6)
-        try:
-            cron_parts = report["schedule_cron"].split()
-            cron_hour = int(cron_parts[1]) if len(cron_parts) >= 2 else 6
-        except (ValueError, IndexError):
-            cron_hour = 6
-
-        # Only run if we're within 30 minutes of the scheduled hour
-        if abs(now.hour - cron_hour) > 0 and abs(now.hour - cron_hour) != 24:
-            continue
-
         logger.info("Running scheduled report: %s (id=%d)", report["name"], report["id"])
 
         # Create output record
@@ -49,53 +49,48 @@ async def fetch_acoustic_events(
     return 0
 
 
-async def correlate_acoustic_to_ais(
-    event_id: int,
+def _correlation_confidence(
+    distance_m: float, time_delta_s: float, radius_m: float, time_window_hours: float,
+) -> float:
+    """Confidence decays linearly with distance and time."""
+    dist_conf = max(0.0, 1.0 - (distance_m / radius_m))
+    time_conf = max(0.0, 1.0 - (abs(time_delta_s) / (time_window_hours * 3600)))
+    return round((dist_conf + time_conf) / 2.0, 4)
+
+
+async def correlate_acoustic_batch(
+    event_ids: list[int],
     time_window_hours: float = 2,
     radius_km: float = 100,
-) -> dict | None:
-    """Find the closest AIS vessel within a time/space window of an
-    acoustic event.
+) -> dict[int, dict]:
+    """Correlate many acoustic events with their closest AIS vessels.
 
-    Uses ST_DWithin with geography cast for accurate distance on the
-    WGS84 ellipsoid.
+    One LATERAL nearest-position search per event, all in a single
+    statement, followed by a single bulk UPDATE of the matched events.
 
     Parameters
     ----------
-    event_id : id of the acoustic event to correlate
+    event_ids : ids of the acoustic events to correlate
     time_window_hours : hours before/after event_time to search for AIS positions
     radius_km : spatial search radius in kilometres
 
     Returns
     -------
-    dict with match details, or None if no vessel is found.
+    Mapping of event_id -> match details for events that matched.
+    Unknown events, events missing geom/time, and events without a
+    vessel in the window are absent.
     """
+    if not event_ids:
+        return {}
+
     db = get_db()
     radius_m = radius_km * 1000.0
 
     async with db.acquire() as conn:
-        # Fetch the acoustic event
-        event = await conn.fetchrow(
+        rows = await conn.fetch(
             """
-            SELECT id, geom, event_time, source, event_type, magnitude
-            FROM acoustic_events
-            WHERE id = $1
-            """,
-            event_id,
-        )
-
-        if not event:
-            logger.warning("Acoustic event %d not found", event_id)
-            return None
-
-        if event["geom"] is None or event["event_time"] is None:
-            logger.warning("Acoustic event %d missing geom or time", event_id)
-            return None
-
-        # Find the closest AIS position within the time/space window
-        match = await conn.fetchrow(
-            """
-            SELECT vp.mmsi,
+            SELECT ae.id AS event_id,
+                   vp.mmsi,
                    v.name AS vessel_name,
                    v.ship_type::text AS ship_type,
                    ST_X(vp.geom) AS vessel_lon,
@@ -123,55 +118,88 @@ async def correlate_acoustic_to_ais(
                 LIMIT 1
             ) vp
             LEFT JOIN vessels v ON v.mmsi = vp.mmsi
-            WHERE ae.id = $1
+            WHERE ae.id = ANY($1::bigint[])
+              AND ae.geom IS NOT NULL
             """,
-            event_id,
+            event_ids,
             time_window_hours,
             radius_m,
         )
 
-        if not match:
-            logger.info("No AIS match for acoustic event %d", event_id)
-            return None
+        results: dict[int, dict] = {}
+        for match in rows:
+            dist_m = float(match["distance_m"])
+            time_delta = float(match["time_delta_s"])
+            results[match["event_id"]] = {
+                "event_id": match["event_id"],
+                "mmsi": match["mmsi"],
+                "vessel_name": match["vessel_name"],
+                "ship_type": match["ship_type"],
+                "vessel_lon": float(match["vessel_lon"]),
+                "vessel_lat": float(match["vessel_lat"]),
+                "sog": float(match["sog"]) if match["sog"] is not None else None,
+                "distance_m": round(dist_m, 1),
+                "time_delta_s": round(time_delta, 1),
+                "ais_time": match["ais_time"].isoformat(),
+                "correlation_confidence": _correlation_confidence(
+                    dist_m, time_delta, radius_m, time_window_hours,
+                ),
+            }
+
+        if results:
+            # Update the acoustic events with their correlations
+            await conn.execute(
+                """
+                UPDATE acoustic_events ae
+                SET correlated_mmsi = m.mmsi,
+                    correlation_confidence = m.confidence
+                FROM unnest($1::bigint[], $2::bigint[], $3::float8[]) AS m(id, mmsi, confidence)
+                WHERE ae.id = m.id
+                """,
+                list(results),
+                [r["mmsi"] for r in results.values()],
+                [r["correlation_confidence"] for r in results.values()],
+            )
 
-        # Compute a correlation confidence based on distance and time proximity
-        dist_m = float(match["distance_m"])
-        time_delta = abs(float(match["time_delta_s"]))
-        # Confidence decays linearly with distance and time
-        dist_conf = max(0.0, 1.0 - (dist_m / radius_m))
-        time_conf = max(0.0, 1.0 - (time_delta / (time_window_hours * 3600)))
-        correlation_confidence = round((dist_conf + time_conf) / 2.0, 4)
+    logger.info(
+        "Acoustic batch correlation: %d of %d events matched",
+        len(results), len(event_ids),
+    )
+    return results
 
-        # Update the acoustic event with the correlation
-        await conn.execute(
-            """
-            UPDATE acoustic_events
-            SET correlated_mmsi = $1,
-                correlation_confidence = $2
-            WHERE id = $3
-            """,
-            match["mmsi"],
-            correlation_confidence,
-            event_id,
-        )
 
-    result = {
-        "event_id": event_id,
-        "mmsi": match["mmsi"],
-        "vessel_name": match["vessel_name"],
-        "ship_type": match["ship_type"],
-        "vessel_lon": float(match["vessel_lon"]),
-        "vessel_lat": float(match["vessel_lat"]),
-        "sog": float(match["sog"]) if match["sog"] is not None else None,
-        "distance_m": round(dist_m, 1),
-        "time_delta_s": round(float(match["time_delta_s"]), 1),
-        "ais_time": match["ais_time"].isoformat(),
-        "correlation_confidence": correlation_confidence,
-    }
+async def correlate_acoustic_to_ais(
+    event_id: int,
+    time_window_hours: float = 2,
+    radius_km: float = 100,
+) -> dict | None:
+    """Find the closest AIS vessel within a time/space window of an
+    acoustic event.
+
+    Uses ST_DWithin with geography cast for accurate distance on the
+    WGS84 ellipsoid.
+
+    Parameters
+    ----------
+    event_id : id of the acoustic event to correlate
+    time_window_hours : hours before/after event_time to search for AIS positions
+    radius_km : spatial search radius in kilometres
+
+    Returns
+    -------
+    dict with match details, or None if no vessel is found.
+    """
+    matches = await correlate_acoustic_batch(
+        [event_id], time_window_hours=time_window_hours, radius_km=radius_km,
+    )
+    result = matches.get(event_id)
+    if result is None:
+        logger.info("No AIS match for acoustic event %d", event_id)
+        return None
 
     logger.info(
         "Acoustic event %d correlated to MMSI %d (dist=%.0fm, conf=%.2f)",
-        event_id, match["mmsi"], dist_m, correlation_confidence,
+        event_id, result["mmsi"], result["distance_m"], result["correlation_confidence"],
     )
     return result
 
@@ -2,6 +2,8 @@
 
 import logging
 
+import numpy as np
+
 from app.database import get_db
 
 logger = logging.getLogger("poseidon.aoi")
@@ -9,35 +11,42 @@ logger = logging.getLogger("poseidon.aoi")
 
 async def create_aoi(
     name: str,
-    polygon_coords: list[list[float]],
+    polygon_coords: np.ndarray | list[list[float]],
     description: str | None = None,
     alert_vessel_types: list[str] | None = None,
     alert_min_risk_score: int = 0,
 ) -> dict:
     """Create a new Area of Interest from polygon coordinates.
 
-    polygon_coords: list of [lon, lat] pairs forming a closed polygon.
+    polygon_coords: (N, 2) array of [lon, lat] vertices; the ring is
+    closed here if the caller left it open.
     """
-    if len(polygon_coords) < 3:
-        raise ValueError("Polygon must have at least 3 points")
+    coords = np.asarray(polygon_coords, dtype=np.float64)
+    if coords.ndim != 2 or coords.shape[1] != 2 or coords.shape[0] < 3:
+        raise ValueError("Polygon must have at least 3 [lon, lat] points")
 
     # Close the ring if not already closed
-    if polygon_coords[0] != polygon_coords[-1]:
-        polygon_coords.append(polygon_coords[0])
-
-    ring = ", ".join(f"{c[0]} {c[1]}" for c in polygon_coords)
-    wkt = f"SRID=4326;POLYGON(({ring}))"
+    if not np.array_equal(coords[0], coords[-1]):
+        coords = np.vstack([coords, coords[:1]])
 
     db = get_db()
     async with db.acquire() as conn:
         row = await conn.fetchrow(
             """
             INSERT INTO areas_of_interest (name, description, geom, alert_vessel_types, alert_min_risk_score)
-            VALUES ($1, $2, ST_GeomFromEWKT($3), $4, $5)
+            VALUES (
+                $1, $2,
+                ST_SetSRID(ST_MakePolygon(ST_MakeLine(ARRAY(
+                    SELECT ST_MakePoint(v.lon, v.lat)
+                    FROM unnest($3::float8[], $4::float8[]) WITH ORDINALITY AS v(lon, lat, n)
+                    ORDER BY v.n
+                ))), 4326),
+                $5, $6
+            )
             RETURNING id, name, description, active, created_at,
                       ST_AsGeoJSON(geom)::json AS geojson
             """,
-            name, description, wkt,
+            name, description, coords[:, 0].tolist(), coords[:, 1].tolist(),
             alert_vessel_types or [],
             alert_min_risk_score,
         )
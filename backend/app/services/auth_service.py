@@ -4,6 +4,7 @@ Handles user registration, login, password hashing, and JWT token generation.
 Auth is gated behind the `auth_enabled` config flag.
 """
 
+import asyncio
 import logging
 from datetime import datetime, timezone, timedelta
 
@@ -15,7 +16,16 @@ from app.config import settings
 
 logger = logging.getLogger("poseidon.auth_service")
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# New hashes use argon2id; existing bcrypt hashes still verify and are
+# transparently upgraded on the next successful login.
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated="auto",
+    argon2__type="ID",
+    argon2__time_cost=2,
+    argon2__memory_cost=65536,
+    argon2__parallelism=2,
+)
 
 ALGORITHM = "HS256"
 
@@ -28,6 +38,19 @@ def verify_password(plain: str, hashed: str) -> bool:
     return pwd_context.verify(plain, hashed)
 
 
+# Hashing is deliberately CPU-expensive (~50-100 ms); both argon2-cffi and
+# bcrypt release the GIL, so running them in a worker thread keeps the
+# event loop responsive and lets concurrent logins use multiple cores.
+
+async def hash_password_async(password: str) -> str:
+    return await asyncio.to_thread(hash_password, password)
+
+
+async def verify_and_update_password(plain: str, hashed: str) -> tuple[bool, str | None]:
+    """Verify off the event loop; also returns a new hash if the stored one is outdated."""
+    return await asyncio.to_thread(pwd_context.verify_and_update, plain, hashed)
+
+
 def create_access_token(data: dict, expires_delta: timedelta | None = None) -> str:
     to_encode = data.copy()
     expire = datetime.now(timezone.utc) + (expires_delta or timedelta(minutes=settings.jwt_expire_minutes))
@@ -46,7 +69,7 @@ def decode_token(token: str) -> dict | None:
 async def register_user(username: str, email: str, password: str, role: str = "analyst") -> dict:
     """Register a new user. Returns user dict (without password)."""
     db = get_db()
-    hashed = hash_password(password)
+    hashed = await hash_password_async(password)
 
     try:
         row = await db.fetchrow(
@@ -86,13 +109,20 @@ async def authenticate_user(username: str, password: str) -> dict | None:
     if not row["is_active"]:
         return None
 
-    if not verify_password(password, row["hashed_password"]):
+    valid, new_hash = await verify_and_update_password(password, row["hashed_password"])
+    if not valid:
         return None
 
-    # Update last login
+    # Update last login, upgrading legacy bcrypt hashes to argon2id
     await db.execute(
-        "UPDATE users SET last_login = NOW() WHERE id = $1",
+        """
+        UPDATE users
+        SET last_login = NOW(),
+            hashed_password = COALESCE($2, hashed_password)
+        WHERE id = $1
+        """,
         row["id"],
+        new_hash,
     )
 
     return {
@@ -4,21 +4,22 @@ import json
 import logging
 from pathlib import Path
 
-from shapely.geometry import shape, Point
+import numpy as np
+import shapely
+from shapely.geometry import shape
 from shapely.ops import unary_union
-from shapely.prepared import prep
 
 logger = logging.getLogger("poseidon.coastline")
 
 # 50 nautical miles in degrees (approximate at equator: 1 degree ≈ 60 nm)
 BUFFER_DEG = 50.0 / 60.0  # ~0.8333 degrees
 
-_prepared_buffer = None
+_buffer_geom = None
 
 
 async def init_coastline_buffer():
     """Load Natural Earth land polygons, buffer by 50nm, and prepare for fast queries."""
-    global _prepared_buffer
+    global _buffer_geom
 
     geojson_path = Path(__file__).parent.parent / "data" / "ne_110m_land.geojson"
     logger.info(f"Loading coastline data from {geojson_path}")
@@ -34,17 +35,30 @@ async def init_coastline_buffer():
 
     merged = unary_union(polygons)
     buffered = merged.buffer(BUFFER_DEG)
-    _prepared_buffer = prep(buffered)
+    # Prepared in place so contains_xy can use its spatial index
+    shapely.prepare(buffered)
+    _buffer_geom = buffered
 
     logger.info("Coastline buffer initialized (50nm from land)")
 
 
 def classify_receiver(lon: float, lat: float) -> str:
     """Return 'terrestrial' if point is within 50nm of coastline, else 'satellite'."""
-    if _prepared_buffer is None:
+    if _buffer_geom is None:
         return "unknown"
 
-    point = Point(lon, lat)
-    if _prepared_buffer.contains(point):
+    if shapely.contains_xy(_buffer_geom, lon, lat):
         return "terrestrial"
     return "satellite"
+
+
+def classify_receivers(lons, lats) -> list[str]:
+    """Vectorized classify_receiver for a batch; non-finite coordinates are 'unknown'."""
+    lons = np.asarray(lons, dtype=np.float64)
+    lats = np.asarray(lats, dtype=np.float64)
+    if _buffer_geom is None:
+        return ["unknown"] * len(lons)
+
+    classes = np.where(shapely.contains_xy(_buffer_geom, lons, lats), "terrestrial", "satellite")
+    classes[~(np.isfinite(lons) & np.isfinite(lats))] = "unknown"
+    return classes.tolist()
@@ -1,7 +1,9 @@
 """EEZ (Exclusive Economic Zone) boundary service.
 
 Loads EEZ GeoJSON and provides spatial queries for vessel-EEZ interaction.
-Uses shapely PreparedGeometry for fast point-in-polygon checks.
+Uses an STRtree of zone envelopes to pick candidates and geometries
+prepared in place for the exact point-in-polygon check, per point or
+vectorized over a batch.
 """
 
 import json
@@ -9,8 +11,10 @@ import logging
 from pathlib import Path
 from datetime import datetime, timezone
 
+import numpy as np
+import shapely
+from shapely import STRtree
 from shapely.geometry import shape, Point
-from shapely.prepared import prep
 
 from app.database import get_db
 
@@ -18,12 +22,13 @@ logger = logging.getLogger("poseidon.eez_service")
 
 # In-memory EEZ geometries for fast checks
 _eez_zones: list[dict] = []
-_prepared_geoms: list = []
+_zone_geoms: np.ndarray = np.empty(0, dtype=object)
+_eez_tree: STRtree | None = None
 
 
 async def init_eez_zones() -> int:
     """Load EEZ zones from DB into memory with PreparedGeometry for fast checks."""
-    global _eez_zones, _prepared_geoms
+    global _eez_zones, _zone_geoms, _eez_tree
     db = get_db()
 
     rows = await db.fetch(
@@ -36,7 +41,6 @@ async def init_eez_zones() -> int:
     )
 
     _eez_zones = []
-    _prepared_geoms = []
 
     for r in rows:
         geojson = json.loads(r["geojson"])
@@ -49,27 +53,57 @@ async def init_eez_zones() -> int:
             "mrgid": r["mrgid"],
             "geom": geom,
         })
-        _prepared_geoms.append(prep(geom))
+
+    _zone_geoms = np.array([z["geom"] for z in _eez_zones], dtype=object)
+    shapely.prepare(_zone_geoms)
+    _eez_tree = STRtree(_zone_geoms)
 
     logger.info("Loaded %d EEZ zones into memory", len(_eez_zones))
     return len(_eez_zones)
 
 
+def _zone_info(z: dict) -> dict:
+    return {
+        "id": z["id"],
+        "name": z["name"],
+        "sovereign": z["sovereign"],
+        "iso_ter1": z["iso_ter1"],
+    }
+
+
 def find_eez_for_point(lon: float, lat: float) -> dict | None:
     """Find which EEZ a lon/lat point falls within. Returns zone dict or None."""
+    if _eez_tree is None:
+        return None
     pt = Point(lon, lat)
-    for i, pg in enumerate(_prepared_geoms):
-        if pg.contains(pt):
-            z = _eez_zones[i]
-            return {
-                "id": z["id"],
-                "name": z["name"],
-                "sovereign": z["sovereign"],
-                "iso_ter1": z["iso_ter1"],
-            }
+    # Only zones whose envelope contains the point; sorted so overlapping
+    # zones resolve in load order
+    for i in sorted(_eez_tree.query(pt)):
+        if _zone_geoms[i].covers(pt):
+            return _zone_info(_eez_zones[i])
     return None
 
 
+def find_eezs_for_points(lons, lats) -> list[dict | None]:
+    """Vectorized find_eez_for_point over parallel lon/lat sequences."""
+    points = shapely.points(np.asarray(lons, dtype=np.float64), np.asarray(lats, dtype=np.float64))
+    result: list[dict | None] = [None] * len(points)
+    if _eez_tree is None or not len(points):
+        return result
+
+    # Envelope candidates for every point, then one prepared covers() pass
+    pt_idx, zone_idx = _eez_tree.query(points)
+    hit = shapely.covers(_zone_geoms[zone_idx], points[pt_idx])
+
+    best: dict[int, int] = {}
+    for p, z in zip(pt_idx[hit].tolist(), zone_idx[hit].tolist()):
+        if p not in best or z < best[p]:
+            best[p] = z
+    for p, z in best.items():
+        result[p] = _zone_info(_eez_zones[z])
+    return result
+
+
 async def record_eez_event(
     mmsi: int, eez_id: int, eez_name: str,
     event_type: str, lon: float, lat: float,
@@ -88,6 +122,61 @@ async def record_eez_event(
     return row["id"]
 
 
+async def apply_eez_states(
+    conn, mmsis: list[int], eez_ids: list[int | None], eez_names: list[str | None],
+    lons: list[float], lats: list[float], timestamps: list[datetime],
+) -> tuple[int, int]:
+    """Record each vessel's current EEZ (or None) and log the crossings.
+
+    Diffs against vessel_eez_state server-side: only vessels whose EEZ
+    changed are rewritten, and an exit/entry event is inserted for each
+    side of the change. Returns (entries, exits).
+    """
+    row = await conn.fetchrow(
+        """
+        WITH cur AS (
+            SELECT * FROM unnest($1::bigint[], $2::int[], $3::text[],
+                                 $4::float8[], $5::float8[], $6::timestamptz[])
+                AS c(mmsi, eez_id, eez_name, lon, lat, ts)
+        ),
+        prev AS (
+            SELECT s.mmsi, s.eez_id
+            FROM vessel_eez_state s
+            JOIN cur USING (mmsi)
+        ),
+        changed AS (
+            INSERT INTO vessel_eez_state (mmsi, eez_id)
+            SELECT mmsi, eez_id FROM cur
+            ON CONFLICT (mmsi) DO UPDATE SET eez_id = EXCLUDED.eez_id, updated_at = NOW()
+            WHERE vessel_eez_state.eez_id IS DISTINCT FROM EXCLUDED.eez_id
+            RETURNING mmsi
+        ),
+        events AS (
+            INSERT INTO eez_entry_events (mmsi, eez_id, eez_name, event_type, geom, timestamp)
+            SELECT c.mmsi, p.eez_id, COALESCE(z.name, ''), 'exit',
+                   ST_SetSRID(ST_MakePoint(c.lon, c.lat), 4326), c.ts
+            FROM changed ch
+            JOIN cur c USING (mmsi)
+            JOIN prev p USING (mmsi)
+            LEFT JOIN eez_zones z ON z.id = p.eez_id
+            WHERE p.eez_id IS NOT NULL
+            UNION ALL
+            SELECT c.mmsi, c.eez_id, c.eez_name, 'entry',
+                   ST_SetSRID(ST_MakePoint(c.lon, c.lat), 4326), c.ts
+            FROM changed ch
+            JOIN cur c USING (mmsi)
+            WHERE c.eez_id IS NOT NULL
+            RETURNING event_type
+        )
+        SELECT COUNT(*) FILTER (WHERE event_type = 'entry') AS entries,
+               COUNT(*) FILTER (WHERE event_type = 'exit') AS exits
+        FROM events
+        """,
+        mmsis, eez_ids, eez_names, lons, lats, timestamps,
+    )
+    return row["entries"], row["exits"]
+
+
 async def get_eez_events(
     mmsi: int | None = None,
     hours: int = 24,
@@ -161,3 +250,28 @@ async def get_eez_zones_geojson() -> dict:
         })
 
     return {"type": "FeatureCollection", "features": features}
+
+
+async def get_eez_tile(z: int, x: int, y: int) -> bytes:
+    """Render one Mapbox Vector Tile (layer 'eez') for the given z/x/y."""
+    db = get_db()
+    tile = await db.fetchval(
+        """
+        WITH bounds AS (
+            SELECT ST_TileEnvelope($1, $2, $3) AS env_3857,
+                   ST_Transform(ST_TileEnvelope($1, $2, $3), 4326) AS env_4326
+        ),
+        mvtgeom AS (
+            SELECT ST_AsMVTGeom(
+                       ST_Transform(z.geom, 3857), b.env_3857, 4096, 64, true
+                   ) AS geom,
+                   z.id, z.name, z.sovereign, z.iso_ter1, z.mrgid
+            FROM eez_zones z, bounds b
+            WHERE z.geom && b.env_4326
+        )
+        SELECT ST_AsMVT(mvtgeom, 'eez', 4096, 'geom')
+        FROM mvtgeom
+        """,
+        z, x, y,
+    )
+    return bytes(tile) if tile else b""
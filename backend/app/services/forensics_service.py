@@ -1,6 +1,7 @@
 """Forensic message queries and summaries."""
 
 import logging
+from datetime import datetime
 
 from app.database import get_db
 
@@ -8,8 +9,18 @@ logger = logging.getLogger("poseidon.forensics")
 
 
 async def get_forensic_messages(
-    mmsi: int, hours: int = 24, flagged_only: bool = False, limit: int = 200
+    mmsi: int,
+    hours: int = 24,
+    flagged_only: bool = False,
+    limit: int = 200,
+    cursor_ts: datetime | None = None,
+    cursor_id: int | None = None,
 ) -> list[dict]:
+    """Return one page of raw messages, newest first.
+
+    Pass the (timestamp, id) of the last message of the previous page as
+    cursor_ts/cursor_id to continue from there (keyset pagination).
+    """
     db = get_db()
     async with db.acquire() as conn:
         where = "mmsi = $1 AND timestamp > NOW() - make_interval(hours => $2)"
@@ -18,6 +29,12 @@ async def get_forensic_messages(
                 " AND (flag_impossible_speed OR flag_sart_on_non_sar"
                 " OR flag_no_identity OR flag_position_jump)"
             )
+        # Later pages get the plain row comparison in their own statement
+        # text, so it stays an index condition under a generic plan
+        args = [mmsi, hours, limit]
+        if cursor_ts is not None:
+            where += " AND (timestamp, id) < ($4, $5)"
+            args += [cursor_ts, cursor_id]
 
         rows = await conn.fetch(
             f"""
@@ -28,12 +45,10 @@ async def get_forensic_messages(
                    receiver_class, lat, lon, sog, timestamp, received_at
             FROM ais_raw_messages
             WHERE {where}
-            ORDER BY timestamp DESC
+            ORDER BY timestamp DESC, id DESC
             LIMIT $3
             """,
-            mmsi,
-            hours,
-            limit,
+            *args,
         )
 
         return [
@@ -59,6 +74,29 @@ async def get_forensic_messages(
         ]
 
 
+async def get_forensic_summary_validator(mmsi: int, hours: int = 24) -> tuple:
+    """Cheap change marker for get_forensic_summary's window.
+
+    Everything here is served by idx_raw_messages_mmsi_ts_id. The oldest
+    timestamp is included because the window slides: rows aging out
+    change the summary even when nothing new has arrived. The row count
+    and highest id catch late arrivals (e.g. satellite AIS) whose report
+    time lands inside the window without moving either end of it.
+    """
+    db = get_db()
+    row = await db.fetchrow(
+        """
+        SELECT MAX(timestamp) AS newest, MIN(timestamp) AS oldest,
+               COUNT(*) AS total, MAX(id) AS last_id
+        FROM ais_raw_messages
+        WHERE mmsi = $1 AND timestamp > NOW() - make_interval(hours => $2)
+        """,
+        mmsi,
+        hours,
+    )
+    return row["newest"], row["oldest"], row["total"], row["last_id"]
+
+
 async def get_forensic_summary(mmsi: int, hours: int = 24) -> dict:
     db = get_db()
     async with db.acquire() as conn:
@@ -68,11 +68,14 @@ async def _sar_confidence(mmsi: int, conn) -> float:
         mmsi,
     )
 
-    if not row or row["cnt"] == 0:
+    return _sar_confidence_from_count(row["cnt"] if row else 0)
+
+
+def _sar_confidence_from_count(cnt: int) -> float:
+    if not cnt:
         return 0.1  # low prior - no SAR evidence
 
     # More matches -> higher confidence, capped at 0.9
-    cnt = row["cnt"]
     return min(0.9, 0.5 + 0.1 * cnt)
 
 
@@ -98,10 +101,13 @@ async def _viirs_confidence(mmsi: int, conn) -> float:
         float(VIIRS_SEARCH_RADIUS_M),
     )
 
-    if not row or row["cnt"] == 0:
+    return _viirs_confidence_from_count(row["cnt"] if row else 0)
+
+
+def _viirs_confidence_from_count(cnt: int) -> float:
+    if not cnt:
         return 0.1  # no VIIRS evidence
 
-    cnt = row["cnt"]
     return min(0.85, 0.4 + 0.1 * cnt)
 
 
@@ -118,12 +124,18 @@ async def _acoustic_confidence(mmsi: int, conn) -> float:
         mmsi,
     )
 
-    if not row or row["cnt"] == 0:
+    if not row:
+        return 0.1
+    return _acoustic_confidence_from_stats(row["cnt"], row["max_conf"])
+
+
+def _acoustic_confidence_from_stats(cnt: int, max_conf: float | None) -> float:
+    if not cnt:
         return 0.1  # no acoustic evidence
 
     # Use the highest single correlation confidence, boosted by count
-    base = float(row["max_conf"]) if row["max_conf"] is not None else 0.3
-    return min(0.9, base + 0.05 * (row["cnt"] - 1))
+    base = float(max_conf) if max_conf is not None else 0.3
+    return min(0.9, base + 0.05 * (cnt - 1))
 
 
 # ---------------------------------------------------------------------------
@@ -159,6 +171,35 @@ def _bayesian_posterior(confidences: list[float]) -> float:
     return 1.0 / (1.0 + math.exp(diff))
 
 
+def _classify(posterior: float) -> str:
+    """Map a posterior score onto the fusion classification buckets."""
+    if posterior >= 0.8:
+        return "confirmed"
+    if posterior >= 0.5:
+        return "probable"
+    if posterior >= 0.3:
+        return "possible"
+    return "low_confidence"
+
+
+def _fusion_record(
+    row, mmsi: int,
+    ais_conf: float, sar_conf: float, viirs_conf: float, acoustic_conf: float,
+    posterior: float, classification: str,
+) -> dict:
+    return {
+        "id": row["id"],
+        "mmsi": mmsi,
+        "timestamp": row["timestamp"].isoformat(),
+        "ais_confidence": round(ais_conf, 4),
+        "sar_confidence": round(sar_conf, 4),
+        "viirs_confidence": round(viirs_conf, 4),
+        "acoustic_confidence": round(acoustic_conf, 4),
+        "posterior_score": round(posterior, 4),
+        "classification": classification,
+    }
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
@@ -195,14 +236,7 @@ async def compute_fusion(mmsi: int) -> dict:
         ])
 
         # --- Classify intent based on posterior ---
-        if posterior >= 0.8:
-            classification = "confirmed"
-        elif posterior >= 0.5:
-            classification = "probable"
-        elif posterior >= 0.3:
-            classification = "possible"
-        else:
-            classification = "low_confidence"
+        classification = _classify(posterior)
 
         # --- Persist ---
         row = await conn.fetchrow(
@@ -222,17 +256,10 @@ async def compute_fusion(mmsi: int) -> dict:
             classification,
         )
 
-    result = {
-        "id": row["id"],
-        "mmsi": mmsi,
-        "timestamp": row["timestamp"].isoformat(),
-        "ais_confidence": round(ais_conf, 4),
-        "sar_confidence": round(sar_conf, 4),
-        "viirs_confidence": round(viirs_conf, 4),
-        "acoustic_confidence": round(acoustic_conf, 4),
-        "posterior_score": round(posterior, 4),
-        "classification": classification,
-    }
+    result = _fusion_record(
+        row, mmsi, ais_conf, sar_conf, viirs_conf, acoustic_conf,
+        posterior, classification,
+    )
 
     logger.info(
         "Fusion for MMSI %d: posterior=%.3f (%s)",
@@ -241,6 +268,104 @@ async def compute_fusion(mmsi: int) -> dict:
     return result
 
 
+async def compute_fusion_many(mmsis: list[int]) -> list[dict]:
+    """Compute and store fusion results for many vessels at once.
+
+    Equivalent to calling compute_fusion() for each MMSI, but gathers
+    every signal input in a single set-based query and persists all
+    results with a single INSERT, so the round-trip count does not grow
+    with the number of vessels. MMSIs with no vessels row are skipped
+    rather than failing the batch, so the result may be shorter than
+    the input.
+    """
+    mmsis = list(dict.fromkeys(mmsis))
+    if not mmsis:
+        return []
+
+    db = get_db()
+
+    async with db.acquire() as conn:
+        signal_rows = await conn.fetch(
+            """
+            SELECT m.mmsi,
+                   lvp.timestamp AS last_seen,
+                   sar.cnt AS sar_cnt,
+                   viirs.cnt AS viirs_cnt,
+                   ac.cnt AS acoustic_cnt,
+                   ac.max_conf AS acoustic_max_conf
+            FROM unnest($1::bigint[]) AS m(mmsi)
+            -- signal_fusion_results.mmsi references vessels; dropping unknown
+            -- MMSIs here keeps one stray id from failing the whole INSERT
+            JOIN vessels v ON v.mmsi = m.mmsi
+            LEFT JOIN latest_vessel_positions lvp ON lvp.mmsi = m.mmsi
+            CROSS JOIN LATERAL (
+                SELECT COUNT(*) AS cnt
+                FROM sar_vessel_matches
+                WHERE mmsi = m.mmsi
+                  AND created_at > NOW() - INTERVAL '7 days'
+            ) sar
+            CROSS JOIN LATERAL (
+                SELECT COUNT(*) AS cnt
+                FROM viirs_anomalies va
+                WHERE lvp.geom IS NOT NULL
+                  AND va.observation_date > (CURRENT_DATE - INTERVAL '7 days')
+                  AND ST_DWithin(va.geom::geography, lvp.geom::geography, $2)
+            ) viirs
+            CROSS JOIN LATERAL (
+                SELECT COUNT(*) AS cnt,
+                       MAX(correlation_confidence) AS max_conf
+                FROM acoustic_events
+                WHERE correlated_mmsi = m.mmsi
+                  AND event_time > NOW() - INTERVAL '7 days'
+            ) ac
+            """,
+            mmsis,
+            float(VIIRS_SEARCH_RADIUS_M),
+        )
+
+        computed = []
+        for r in signal_rows:
+            ais_conf = _ais_confidence(r["last_seen"])
+            sar_conf = _sar_confidence_from_count(r["sar_cnt"])
+            viirs_conf = _viirs_confidence_from_count(r["viirs_cnt"])
+            acoustic_conf = _acoustic_confidence_from_stats(
+                r["acoustic_cnt"], r["acoustic_max_conf"],
+            )
+            posterior = _bayesian_posterior([
+                ais_conf, sar_conf, viirs_conf, acoustic_conf,
+            ])
+            computed.append((
+                r["mmsi"], ais_conf, sar_conf, viirs_conf, acoustic_conf,
+                posterior, _classify(posterior),
+            ))
+
+        if not computed:
+            return []
+
+        inserted = await conn.fetch(
+            """
+            INSERT INTO signal_fusion_results
+                (mmsi, ais_confidence, sar_confidence, viirs_confidence,
+                 acoustic_confidence, posterior_score, classification)
+            SELECT * FROM unnest(
+                $1::bigint[], $2::real[], $3::real[], $4::real[],
+                $5::real[], $6::real[], $7::text[]
+            )
+            RETURNING id, mmsi, timestamp
+            """,
+            *(list(col) for col in zip(*computed)),
+        )
+
+    rows_by_mmsi = {r["mmsi"]: r for r in inserted}
+    results = [
+        _fusion_record(rows_by_mmsi[c[0]], *c)
+        for c in computed
+    ]
+
+    logger.info("Fusion computed for %d vessels in one batch", len(results))
+    return results
+
+
 async def get_fusion_history(mmsi: int, limit: int = 20) -> list[dict]:
     """Retrieve past fusion results for a vessel, most recent first."""
     db = get_db()
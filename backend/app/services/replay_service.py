@@ -8,6 +8,8 @@ vessel positions within a specified time range and geographic area.
 import logging
 from datetime import datetime, timezone
 
+import orjson
+
 from app.database import get_db
 
 logger = logging.getLogger("poseidon.replay_service")
@@ -112,72 +114,61 @@ async def get_replay_data(job_id: int) -> dict:
         job_id,
     )
 
-    # Build query based on job parameters
-    query = """
-        SELECT vp.mmsi,
-               ST_X(vp.geom) as lon, ST_Y(vp.geom) as lat,
-               vp.sog, vp.cog, vp.timestamp
-        FROM vessel_positions vp
-        WHERE vp.timestamp >= $1 AND vp.timestamp <= $2
-    """
+    # Build the filter based on job parameters
+    conditions = ["vp.timestamp >= $1 AND vp.timestamp <= $2"]
     params: list = [job["start_time"], job["end_time"]]
     idx = 3
 
     # Filter by MMSI if specified
     if job["mmsi"] is not None:
-        query += f" AND vp.mmsi = ${idx}"
+        conditions.append(f"vp.mmsi = ${idx}")
         params.append(job["mmsi"])
         idx += 1
 
     # Filter by bounding box if specified
     if all(job.get(k) is not None for k in ["min_lon", "min_lat", "max_lon", "max_lat"]):
-        query += f"""
-            AND ST_Intersects(
-                vp.geom,
-                ST_MakeEnvelope(${idx}, ${idx+1}, ${idx+2}, ${idx+3}, 4326)
-            )
-        """
+        conditions.append(
+            f"ST_Intersects(vp.geom, ST_MakeEnvelope(${idx}, ${idx+1}, ${idx+2}, ${idx+3}, 4326))"
+        )
         params.extend([job["min_lon"], job["min_lat"], job["max_lon"], job["max_lat"]])
         idx += 4
 
-    query += " ORDER BY vp.timestamp ASC"
-
-    rows = await db.fetch(query, *params)
-
-    # Group into time buckets (1-minute intervals)
-    frames: dict[str, list[dict]] = {}
-
-    for row in rows:
-        ts = row["timestamp"]
-        # Truncate to minute for bucketing
-        bucket_ts = ts.replace(second=0, microsecond=0)
-        bucket_key = bucket_ts.isoformat()
-
-        if bucket_key not in frames:
-            frames[bucket_key] = []
-
-        # Deduplicate by MMSI within the same bucket (keep latest)
-        existing_mmsis = {v["mmsi"] for v in frames[bucket_key]}
-        if row["mmsi"] in existing_mmsis:
-            # Replace with newer position
-            frames[bucket_key] = [
-                v for v in frames[bucket_key] if v["mmsi"] != row["mmsi"]
-            ]
-
-        frames[bucket_key].append({
-            "mmsi": row["mmsi"],
-            "lon": float(row["lon"]),
-            "lat": float(row["lat"]),
-            "sog": float(row["sog"]) if row["sog"] is not None else 0,
-            "cog": float(row["cog"]) if row["cog"] is not None else 0,
-        })
+    where = " AND ".join(conditions)
+
+    # Bucket into 1-minute frames inside Postgres: DISTINCT ON keeps the
+    # latest position per (bucket, MMSI), then one row per frame is built
+    # with json_agg so only frame-sized rows cross the wire.
+    rows = await db.fetch(
+        f"""
+        SELECT bucket,
+               json_agg(
+                   json_build_object(
+                       'mmsi', mmsi, 'lon', lon, 'lat', lat, 'sog', sog, 'cog', cog
+                   )
+                   ORDER BY ts
+               ) AS vessels
+        FROM (
+            SELECT DISTINCT ON (date_trunc('minute', vp.timestamp), vp.mmsi)
+                   date_trunc('minute', vp.timestamp) AS bucket,
+                   vp.mmsi,
+                   ST_X(vp.geom) AS lon, ST_Y(vp.geom) AS lat,
+                   COALESCE(vp.sog, 0) AS sog, COALESCE(vp.cog, 0) AS cog,
+                   vp.timestamp AS ts
+            FROM vessel_positions vp
+            WHERE {where}
+            ORDER BY date_trunc('minute', vp.timestamp), vp.mmsi, vp.timestamp DESC
+        ) latest
+        GROUP BY bucket
+        ORDER BY bucket
+        """,
+        *params,
+    )
 
-    # Convert to sorted frame list
-    sorted_keys = sorted(frames.keys())
     frame_list = [
-        {"timestamp": key, "vessels": frames[key]}
-        for key in sorted_keys
+        {"timestamp": r["bucket"].isoformat(), "vessels": orjson.loads(r["vessels"])}
+        for r in rows
     ]
+    total_positions = sum(len(f["vessels"]) for f in frame_list)
 
     # Update job status
     await db.execute(
@@ -188,7 +179,7 @@ async def get_replay_data(job_id: int) -> dict:
 
     logger.info(
         "Replay job %d: %d frames, %d total positions",
-        job_id, len(frame_list), len(rows),
+        job_id, len(frame_list), total_positions,
     )
 
     return {
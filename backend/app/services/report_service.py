@@ -6,6 +6,7 @@ risk assessment, track summary, dark activity, SAR detections,
 sanctions screening, Equasis registry, and forensic assessment.
 """
 
+import asyncio
 import json
 import os
 import math
@@ -23,6 +24,10 @@ logger = logging.getLogger("poseidon.report_service")
 
 REPORTS_DIR = "/app/reports"
 
+# A vessel report generated within this window is served again instead of
+# being rebuilt, so reloads and repeat downloads hit the same file (and ETag)
+REPORT_REUSE_SECONDS = 60
+
 
 class PoseidonReport(FPDF):
     """Custom FPDF subclass with Poseidon branding."""
@@ -107,115 +112,23 @@ def _haversine_nm(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     return R_NM * c
 
 
-async def generate_vessel_report(mmsi: int) -> str:
-    """Generate a comprehensive PDF intelligence report for a vessel.
-
-    Args:
-        mmsi: Maritime Mobile Service Identity of the vessel.
-
-    Returns:
-        File path of the generated PDF report.
-
-    Raises:
-        ValueError: If vessel is not found in the database.
+def _render_vessel_report(
+    mmsi: int,
+    vessel: dict,
+    risk_row,
+    track: list,
+    dark_alerts: list,
+    assessment: dict | None,
+    sanctions: dict | None,
+    equasis_data: dict | None,
+    spoof_signals: list,
+    sar_detections: list,
+) -> tuple[str, int, int, int]:
+    """Lay out and write the vessel report PDF (blocking; run in a thread).
+
+    Returns (filepath, track points, dark alerts, SAR detections).
     """
-    db = get_db()
-
-    # 1. Get vessel details
-    vessel = await db.fetchrow(
-        """
-        SELECT v.mmsi, v.imo, v.name, v.callsign, v.ship_type::text,
-               v.ais_type_code, v.dim_bow, v.dim_stern, v.dim_port, v.dim_starboard,
-               v.destination, v.eta,
-               ST_X(lv.geom) as lon, ST_Y(lv.geom) as lat,
-               lv.sog, lv.cog, lv.heading, lv.nav_status::text,
-               lv.timestamp as last_seen
-        FROM vessels v
-        LEFT JOIN latest_vessel_positions lv ON v.mmsi = lv.mmsi
-        WHERE v.mmsi = $1
-        """,
-        mmsi,
-    )
-
-    if not vessel:
-        raise ValueError(f"Vessel with MMSI {mmsi} not found")
-
-    vessel = dict(vessel)
-
-    # 2. Get risk score
-    risk_row = await db.fetchrow(
-        """
-        SELECT overall_score, identity_score, flag_risk_score,
-               anomaly_score, dark_history_score, risk_level, details, scored_at
-        FROM vessel_risk_scores
-        WHERE mmsi = $1
-        ORDER BY scored_at DESC
-        LIMIT 1
-        """,
-        mmsi,
-    )
-
-    # 3. Get recent track (last 7 days)
-    track = await db.fetch(
-        """
-        SELECT ST_X(geom) as lon, ST_Y(geom) as lat, sog, cog, timestamp
-        FROM vessel_positions
-        WHERE mmsi = $1 AND timestamp > NOW() - INTERVAL '7 days'
-        ORDER BY timestamp ASC
-        """,
-        mmsi,
-    )
-
-    # 4. Get dark vessel alerts
-    dark_alerts = await db.fetch(
-        """
-        SELECT id, status::text, gap_hours, last_seen_at, detected_at, resolved_at,
-               ST_X(last_known_geom) as last_known_lon, ST_Y(last_known_geom) as last_known_lat,
-               last_sog, last_cog, search_radius_nm
-        FROM dark_vessel_alerts
-        WHERE mmsi = $1
-        ORDER BY detected_at DESC
-        LIMIT 20
-        """,
-        mmsi,
-    )
-
-    # 5. Get forensic assessment, sanctions, equasis
-    assessment = await compute_assessment(mmsi)
-    sanctions = await screen_vessel(
-        mmsi=mmsi,
-        imo=vessel.get("imo"),
-        name=vessel.get("name"),
-    )
-    equasis_data = None
-    if vessel.get("imo"):
-        equasis_data = await lookup_vessel(vessel["imo"])
-
-    spoof_signals = await db.fetch(
-        """SELECT anomaly_type::text, ST_X(geom) AS lon, ST_Y(geom) AS lat, detected_at
-           FROM spoof_signals WHERE mmsi = $1 ORDER BY detected_at DESC LIMIT 10""",
-        mmsi,
-    )
-
-    # 6. Get SAR detections if any
-    sar_detections = []
-    try:
-        sar_detections = await db.fetch(
-            """
-            SELECT id, ST_X(geom) as lon, ST_Y(geom) as lat,
-                   intensity_db, estimated_length_m, detected_at, matched_mmsi
-            FROM sar_detections
-            WHERE matched_mmsi = $1
-            ORDER BY detected_at DESC
-            LIMIT 10
-            """,
-            mmsi,
-        )
-    except Exception:
-        # SAR detections table may not exist yet
-        logger.debug("SAR detections table not available")
-
-    # 6. Build PDF
+    # Build PDF
     pdf = PoseidonReport()
     pdf.alias_nb_pages()
     pdf.add_page()
@@ -501,9 +414,150 @@ async def generate_vessel_report(mmsi: int) -> str:
 
     pdf.output(filepath)
 
+    return filepath, num_positions, len(dark_list), len(sar_list)
+
+
+async def get_or_generate_vessel_report(mmsi: int, max_age_s: int = REPORT_REUSE_SECONDS) -> str:
+    """Return the path of a vessel report no older than `max_age_s`.
+
+    Reuses the most recent PDF recorded in incident_reports if it is still
+    on disk, otherwise generates a new one.
+    """
+    db = get_db()
+    pdf_path = await db.fetchval(
+        """
+        SELECT pdf_path FROM incident_reports
+        WHERE mmsi = $1 AND report_type = 'vessel' AND pdf_path IS NOT NULL
+          AND created_at > NOW() - make_interval(secs => $2)
+        ORDER BY created_at DESC
+        LIMIT 1
+        """,
+        mmsi,
+        float(max_age_s),
+    )
+    if pdf_path and await asyncio.to_thread(os.path.isfile, pdf_path):
+        return pdf_path
+    return await generate_vessel_report(mmsi)
+
+
+async def generate_vessel_report(mmsi: int) -> str:
+    """Generate a comprehensive PDF intelligence report for a vessel.
+
+    Args:
+        mmsi: Maritime Mobile Service Identity of the vessel.
+
+    Returns:
+        File path of the generated PDF report.
+
+    Raises:
+        ValueError: If vessel is not found in the database.
+    """
+    db = get_db()
+
+    # 1. Get vessel details
+    vessel = await db.fetchrow(
+        """
+        SELECT v.mmsi, v.imo, v.name, v.callsign, v.ship_type::text,
+               v.ais_type_code, v.dim_bow, v.dim_stern, v.dim_port, v.dim_starboard,
+               v.destination, v.eta,
+               ST_X(lv.geom) as lon, ST_Y(lv.geom) as lat,
+               lv.sog, lv.cog, lv.heading, lv.nav_status::text,
+               lv.timestamp as last_seen
+        FROM vessels v
+        LEFT JOIN latest_vessel_positions lv ON v.mmsi = lv.mmsi
+        WHERE v.mmsi = $1
+        """,
+        mmsi,
+    )
+
+    if not vessel:
+        raise ValueError(f"Vessel with MMSI {mmsi} not found")
+
+    vessel = dict(vessel)
+
+    # 2. Get risk score
+    risk_row = await db.fetchrow(
+        """
+        SELECT overall_score, identity_score, flag_risk_score,
+               anomaly_score, dark_history_score, risk_level, details, scored_at
+        FROM vessel_risk_scores
+        WHERE mmsi = $1
+        ORDER BY scored_at DESC
+        LIMIT 1
+        """,
+        mmsi,
+    )
+
+    # 3. Get recent track (last 7 days)
+    track = await db.fetch(
+        """
+        SELECT ST_X(geom) as lon, ST_Y(geom) as lat, sog, cog, timestamp
+        FROM vessel_positions
+        WHERE mmsi = $1 AND timestamp > NOW() - INTERVAL '7 days'
+        ORDER BY timestamp ASC
+        """,
+        mmsi,
+    )
+
+    # 4. Get dark vessel alerts
+    dark_alerts = await db.fetch(
+        """
+        SELECT id, status::text, gap_hours, last_seen_at, detected_at, resolved_at,
+               ST_X(last_known_geom) as last_known_lon, ST_Y(last_known_geom) as last_known_lat,
+               last_sog, last_cog, search_radius_nm
+        FROM dark_vessel_alerts
+        WHERE mmsi = $1
+        ORDER BY detected_at DESC
+        LIMIT 20
+        """,
+        mmsi,
+    )
+
+    # 5. Get forensic assessment, sanctions, equasis
+    assessment = await compute_assessment(mmsi)
+    sanctions = await screen_vessel(
+        mmsi=mmsi,
+        imo=vessel.get("imo"),
+        name=vessel.get("name"),
+    )
+    equasis_data = None
+    if vessel.get("imo"):
+        equasis_data = await lookup_vessel(vessel["imo"])
+
+    spoof_signals = await db.fetch(
+        """SELECT anomaly_type::text, ST_X(geom) AS lon, ST_Y(geom) AS lat, detected_at
+           FROM spoof_signals WHERE mmsi = $1 ORDER BY detected_at DESC LIMIT 10""",
+        mmsi,
+    )
+
+    # 6. Get SAR detections if any
+    sar_detections = []
+    try:
+        sar_detections = await db.fetch(
+            """
+            SELECT id, ST_X(geom) as lon, ST_Y(geom) as lat,
+                   intensity_db, estimated_length_m, detected_at, matched_mmsi
+            FROM sar_detections
+            WHERE matched_mmsi = $1
+            ORDER BY detected_at DESC
+            LIMIT 10
+            """,
+            mmsi,
+        )
+    except Exception:
+        # SAR detections table may not exist yet
+        logger.debug("SAR detections table not available")
+
+    # 6. Build PDF off the event loop; fpdf layout and file output are blocking
+    filepath, num_positions, num_dark, num_sar = await asyncio.to_thread(
+        _render_vessel_report,
+        mmsi, vessel, risk_row, track, dark_alerts,
+        assessment, sanctions, equasis_data, spoof_signals, sar_detections,
+    )
+
     logger.info(
         "Generated report for MMSI %d: %s (%d track points, %d alerts, %d SAR)",
-        mmsi, filepath, num_positions, len(dark_list), len(sar_list),
+        mmsi, filepath, num_positions, num_dark, num_sar,
     )
 
     # Save report metadata to DB
@@ -51,6 +51,11 @@ async def screen_vessel(
     }
 
 
+async def get_cached_screening(mmsi: int | None = None, imo: int | None = None) -> dict | None:
+    """Return a fresh cached screening without contacting OpenSanctions."""
+    return await _get_cached(get_db(), mmsi, imo)
+
+
 async def _get_cached(db, mmsi: int | None, imo: int | None) -> dict | None:
     """Return cached sanctions result if fresh enough."""
     cutoff = datetime.now(timezone.utc) - timedelta(hours=CACHE_TTL_HOURS)
@@ -4,6 +4,7 @@ Generates periodic digest reports (daily, weekly) as PDFs containing
 vessel activity summaries, alert statistics, and key events.
 """
 
+import asyncio
 import os
 import json
 import logging
@@ -182,23 +183,21 @@ async def generate_digest(report_id: int, output_id: int) -> str:
     timestamp_str = now.strftime("%Y%m%d_%H%M%S")
     filename = f"digest_{report_id}_{timestamp_str}.pdf"
     filepath = os.path.join(REPORTS_DIR, filename)
-    pdf.output(filepath)
+    await asyncio.to_thread(pdf.output, filepath)
 
-    # Update output record
+    # Complete the output record and stamp last_run_at on the report in
+    # one statement, so neither can land without the other
     summary = json.dumps(stats)
     await db.execute(
         """
-        UPDATE scheduled_report_outputs
-        SET status = 'completed', pdf_path = $1, summary = $2::jsonb, generated_at = NOW()
-        WHERE id = $3
+        WITH output AS (
+            UPDATE scheduled_report_outputs
+            SET status = 'completed', pdf_path = $1, summary = $2::jsonb, generated_at = NOW()
+            WHERE id = $3
+        )
+        UPDATE scheduled_reports SET last_run_at = NOW() WHERE id = $4
         """,
-        filepath, summary, output_id,
-    )
-
-    # Update last_run_at on the report
-    await db.execute(
-        "UPDATE scheduled_reports SET last_run_at = NOW() WHERE id = $1",
-        report_id,
+        filepath, summary, output_id, report_id,
     )
 
     logger.info("Generated digest report %d -> %s", report_id, filepath)
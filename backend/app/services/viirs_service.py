@@ -5,6 +5,7 @@ stores observations in PostGIS, and detects brightness anomalies
 by comparing against a rolling 30-day baseline.
 """
 
+import asyncio
 import csv
 import io
 import logging
@@ -30,6 +31,37 @@ FIRMS_AREA_URL_TEMPLATE = (
 )
 
 
+def _parse_firms_csv(
+    csv_text: str,
+    bbox: tuple[float, float, float, float] | None,
+) -> list[tuple]:
+    """Parse a FIRMS CSV into (lon, lat, brightness, date) rows inside `bbox`.
+
+    Blocking: the global 24h feed runs to hundreds of thousands of rows,
+    so callers run this in a thread.
+    """
+    rows: list[tuple] = []
+    for row in csv.DictReader(io.StringIO(csv_text)):
+        try:
+            lat = float(row["latitude"])
+            lon = float(row["longitude"])
+            bright = float(row.get("bright_ti4") or row.get("brightness", "0"))
+            acq_date_str = row.get("acq_date", "")
+            if not acq_date_str:
+                continue
+            obs_date = date.fromisoformat(acq_date_str)
+        except (ValueError, KeyError):
+            continue
+
+        if bbox:
+            min_lon, min_lat, max_lon, max_lat = bbox
+            if not (min_lon <= lon <= max_lon and min_lat <= lat <= max_lat):
+                continue
+
+        rows.append((lon, lat, bright, obs_date))
+    return rows
+
+
 async def fetch_viirs_data(
     bbox: tuple[float, float, float, float] | None = None,
     days: int = 1,
@@ -69,28 +101,10 @@ async def fetch_viirs_data(
                 )
             csv_text = await resp.text()
 
-    reader = csv.DictReader(io.StringIO(csv_text))
-
-    rows_to_insert: list[tuple] = []
-    for row in reader:
-        try:
-            lat = float(row["latitude"])
-            lon = float(row["longitude"])
-            bright = float(row.get("bright_ti4") or row.get("brightness", "0"))
-            acq_date_str = row.get("acq_date", "")
-            if not acq_date_str:
-                continue
-            obs_date = date.fromisoformat(acq_date_str)
-        except (ValueError, KeyError):
-            continue
-
-        # Filter to bbox if provided and using global feed
-        if bbox and not map_key:
-            min_lon, min_lat, max_lon, max_lat = bbox
-            if not (min_lon <= lon <= max_lon and min_lat <= lat <= max_lat):
-                continue
-
-        rows_to_insert.append((lon, lat, bright, obs_date))
+    # Filter to bbox if provided and using global feed
+    rows_to_insert = await asyncio.to_thread(
+        _parse_firms_csv, csv_text, bbox if not map_key else None,
+    )
 
     if not rows_to_insert:
         logger.info("VIIRS fetch: 0 observations after filtering")
@@ -0,0 +1,62 @@
+-- ============================================================
+-- 009_performance.sql
+-- Indexes and structures backing API/ingest performance work
+-- ============================================================
+
+-- ===================== Keyset pagination =====================
+-- (detected_at, id) cursor for /heatmap/spoof
+CREATE INDEX IF NOT EXISTS idx_spoof_signals_detected_id
+    ON spoof_signals (detected_at DESC, id DESC);
+
+-- (mmsi, timestamp, id) cursor for /forensics/messages/{mmsi}
+CREATE INDEX IF NOT EXISTS idx_raw_messages_mmsi_ts_id
+    ON ais_raw_messages (mmsi, timestamp DESC, id DESC);
+
+-- ===================== Response cache invalidation ===========
+-- Statement-level NOTIFY so the API can drop cached EEZ/port
+-- GeoJSON as soon as the underlying rows change.
+CREATE OR REPLACE FUNCTION poseidon_notify_invalidate() RETURNS trigger AS $$
+BEGIN
+    PERFORM pg_notify('poseidon_invalidate', TG_TABLE_NAME);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS eez_zones_invalidate ON eez_zones;
+CREATE TRIGGER eez_zones_invalidate
+    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON eez_zones
+    FOR EACH STATEMENT EXECUTE FUNCTION poseidon_notify_invalidate();
+
+DROP TRIGGER IF EXISTS ports_invalidate ON ports;
+CREATE TRIGGER ports_invalidate
+    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON ports
+    FOR EACH STATEMENT EXECUTE FUNCTION poseidon_notify_invalidate();
+
+-- ===================== Recently active vessels ===============
+-- latest_vessel_positions is already one row per MMSI; this serves the
+-- "reported in the last N hours" filter used by fusion batch, the EEZ and
+-- dark-vessel monitors without a full scan.
+CREATE INDEX IF NOT EXISTS idx_latest_timestamp
+    ON latest_vessel_positions (timestamp DESC);
+
+-- ===================== EEZ monitor state =====================
+-- Last known EEZ per vessel (NULL = outside every zone), diffed in SQL by
+-- the EEZ monitor. Unlogged: losing it in a crash only replays one
+-- round of entry events, which isn't worth WAL on every cycle.
+CREATE UNLOGGED TABLE IF NOT EXISTS vessel_eez_state (
+    mmsi        BIGINT PRIMARY KEY,
+    eez_id      INTEGER,
+    updated_at  TIMESTAMPTZ DEFAULT NOW()
+);
+
+-- ===================== Report scheduling =====================
+-- Hour field of schedule_cron ("0 6 * * *" -> 6; malformed -> 6, matching
+-- the scheduler's fallback), so the five-minute due-report check is an
+-- index lookup rather than a regex over every row.
+ALTER TABLE scheduled_reports
+    ADD COLUMN IF NOT EXISTS schedule_hour SMALLINT GENERATED ALWAYS AS (
+        COALESCE(substring(schedule_cron FROM '^\s*\S+\s+(\d{1,2})(\s|$)')::smallint, 6)
+    ) STORED;
+
+CREATE INDEX IF NOT EXISTS idx_scheduled_reports_due
+    ON scheduled_reports (enabled, schedule_hour, last_run_at);
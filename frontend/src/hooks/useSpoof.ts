@@ -77,7 +77,15 @@ export interface SpoofHeatmapPoint {
   weight: number
 }
 
-export async function fetchSpoofHeatmap(hours = 24): Promise<SpoofHeatmapPoint[]> {
-  const { data } = await axios.get(`${API_URL}/api/v1/heatmap/spoof?hours=${hours}`)
-  return data.points
+export async function fetchSpoofHeatmap(hours = 24, maxPoints = 10000): Promise<SpoofHeatmapPoint[]> {
+  const points: SpoofHeatmapPoint[] = []
+  let cursor: string | null = null
+  do {
+    const params: Record<string, string | number> = { hours, page_size: 5000 }
+    if (cursor) params.cursor = cursor
+    const { data } = await axios.get(`${API_URL}/api/v1/heatmap/spoof`, { params })
+    points.push(...data.points)
+    cursor = data.next_cursor
+  } while (cursor && points.length < maxPoints)
+  return points
 }